@@ -1,41 +1,31 @@
 """Action definitions for Git GUI GTK."""
 
-from gi.repository import Gio, Gtk, Gdk
-
+from functools import lru_cache
 
-def get_shortcut_label(accel):
-    """Convert an accelerator string to a human-readable label.
-
-    Args:
-        accel: Accelerator string like '<Ctrl>q'
+from gi.repository import Gio, Gtk, Gdk
 
-    Returns:
-        Human-readable string like 'Ctrl+Q'
-    """
-    if not accel:
-        return ''
-    key, mods = Gtk.accelerator_parse(accel)
-    return Gtk.accelerator_get_label(key, mods)
 
+@lru_cache(maxsize=None)
+def get_action_accel(action_name):
+    """Get the primary accelerator for an action by name.
 
-def get_action_shortcut(action_name):
-    """Get the shortcut label for an action by name.
+    Results are cached; the action tables are fixed at import time.
 
     Args:
         action_name: Action name without prefix (e.g., 'open', 'quit')
 
     Returns:
-        Human-readable shortcut string or empty string
+        Accelerator string like '<Ctrl>q' or empty string
     """
     # Check app actions
     for name, shortcuts, _ in APP_ACTIONS:
         if name == action_name and shortcuts:
-            return get_shortcut_label(shortcuts[0])
+            return shortcuts[0]
 
     # Check window actions
     for name, shortcuts, _ in WINDOW_ACTIONS:
         if name == action_name and shortcuts:
-            return get_shortcut_label(shortcuts[0])
+            return shortcuts[0]
 
     return ''
 
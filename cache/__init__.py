@@ -1,5 +1,6 @@
 """Cache module for Git GUI GTK."""
 
 from .recent_repository_list import RecentRepositoryList
+from .status_cache import StatusCache
 
-__all__ = ['RecentRepositoryList']
+__all__ = ['RecentRepositoryList', 'StatusCache']
@@ -17,9 +17,13 @@ class RecentRepositoryList:
         if not os.path.exists(cls.CONFIG_DIR):
             os.makedirs(cls.CONFIG_DIR)
 
+    # In-memory copy of the list, loaded from CONFIG_FILE on first use and
+    # written through on every change, so reads never touch the disk
+    _cached = None
+
     @classmethod
-    def get_recent(cls):
-        """Get list of recent repository paths."""
+    def _load(cls):
+        """Read the recent list from disk."""
         try:
             if os.path.exists(cls.CONFIG_FILE):
                 with open(cls.CONFIG_FILE, 'r') as f:
@@ -30,14 +34,39 @@ class RecentRepositoryList:
         return []
 
     @classmethod
-    def add_recent(cls, path):
-        """Add a repository path to recent list."""
+    def _save(cls, recent):
+        """Store the recent list in memory and write it to disk."""
+        cls._cached = recent
         cls._ensure_config_dir()
+        try:
+            with open(cls.CONFIG_FILE, 'w') as f:
+                json.dump({'recent': recent}, f, indent=2)
+        except IOError:
+            pass
+
+    @classmethod
+    def get_recent(cls):
+        """Get list of recent repository paths."""
+        if cls._cached is None:
+            cls._cached = cls._load()
+        return list(cls._cached)
+
+    @classmethod
+    def add_recent(cls, path):
+        """Add a repository path to recent list.
+
+        Returns:
+            True if the list changed, False if path was already first
+        """
         recent = cls.get_recent()
 
         # Normalize path
         path = os.path.abspath(path)
 
+        # Already the most recent entry: nothing to write
+        if recent and recent[0] == path:
+            return False
+
         # Remove if already exists (will be re-added at front)
         if path in recent:
             recent.remove(path)
@@ -48,19 +77,10 @@ class RecentRepositoryList:
         # Trim to max
         recent = recent[:cls.MAX_RECENT]
 
-        # Save
-        try:
-            with open(cls.CONFIG_FILE, 'w') as f:
-                json.dump({'recent': recent}, f, indent=2)
-        except IOError:
-            pass
+        cls._save(recent)
+        return True
 
     @classmethod
     def clear_recent(cls):
         """Clear the recent repositories list."""
-        cls._ensure_config_dir()
-        try:
-            with open(cls.CONFIG_FILE, 'w') as f:
-                json.dump({'recent': []}, f, indent=2)
-        except IOError:
-            pass
+        cls._save([])
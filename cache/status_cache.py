@@ -0,0 +1,87 @@
+"""Last known file status per repository, kept across sessions."""
+
+import json
+import os
+import threading
+
+from gitops import FileChange, FileStatus
+
+
+class StatusCache:
+    """Persist the file lists of recently scanned repositories.
+
+    The saved lists are only a preview shown while the first scan of a
+    session runs; they are never used in place of a scan.
+    """
+
+    MAX_REPOS = 10
+    MAX_FILES = 5000
+    CACHE_DIR = os.path.expanduser('~/.cache/git-gui-gtk')
+    CACHE_FILE = os.path.join(CACHE_DIR, 'status.json')
+
+    # Saves may come from several worker threads
+    _lock = threading.Lock()
+
+    @classmethod
+    def _read(cls):
+        """Read the cache file; returns a list of [repo_path, entry] pairs."""
+        try:
+            with open(cls.CACHE_FILE, 'r') as f:
+                data = json.load(f)
+                return [item for item in data.get('repos', [])
+                        if isinstance(item, list) and len(item) == 2]
+        except (OSError, ValueError, AttributeError, TypeError):
+            return []
+
+    @classmethod
+    def load(cls, repo_path):
+        """Return (unstaged, staged) lists saved for a repository, or None."""
+        for path, entry in cls._read():
+            if path == repo_path:
+                try:
+                    return (
+                        [cls._decode(item, False) for item in entry['unstaged']],
+                        [cls._decode(item, True) for item in entry['staged']],
+                    )
+                except (KeyError, TypeError, ValueError):
+                    return None
+        return None
+
+    @classmethod
+    def save(cls, repo_path, unstaged, staged):
+        """Save the file lists of a repository, most recent first.
+
+        Repositories with more than MAX_FILES changes are not saved.
+        Safe to call from a worker thread.
+        """
+        with cls._lock:
+            cls._write(repo_path, unstaged, staged)
+
+    @classmethod
+    def _write(cls, repo_path, unstaged, staged):
+        repos = [item for item in cls._read() if item[0] != repo_path]
+        if len(unstaged) + len(staged) <= cls.MAX_FILES:
+            repos.insert(0, [repo_path, {
+                'unstaged': [cls._encode(f) for f in unstaged],
+                'staged': [cls._encode(f) for f in staged],
+            }])
+        repos = repos[:cls.MAX_REPOS]
+
+        # Write through a temporary file so a crash never leaves it truncated
+        tmp_file = cls.CACHE_FILE + '.tmp'
+        try:
+            os.makedirs(cls.CACHE_DIR, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump({'repos': repos}, f)
+            os.replace(tmp_file, cls.CACHE_FILE)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _encode(file_change):
+        return [file_change.path, file_change.status.value, file_change.old_path]
+
+    @staticmethod
+    def _decode(item, staged):
+        path, status, old_path = item
+        return FileChange(path, FileStatus(status), staged, old_path)
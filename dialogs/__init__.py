@@ -1,58 +1,54 @@
-"""Dialog modules for Git GUI GTK."""
-
-from .push import show_push_dialog
-from .pull import show_pull_dialog
-from .fetch import show_fetch_dialog
-from .add_remote import show_add_remote_dialog
-from .rename_remote import show_rename_remote_dialog
-from .delete_remote import show_delete_remote_dialog
-from .list_remotes import show_list_remotes_dialog
-from .create_branch import show_create_branch_dialog
-from .checkout_branch import show_checkout_branch_dialog
-from .rename_branch import show_rename_branch_dialog
-from .delete_branch import show_delete_branch_dialog
-from .reset_branch import show_reset_branch_dialog
-from .merge import show_merge_dialog
-from .rebase import show_rebase_dialog
-from .database import (
-    show_database_statistics_dialog,
-    show_compress_database_dialog,
-    show_verify_database_dialog,
-)
-from .ssh_key import show_ssh_key_dialog
-from .about import show_about_dialog
-from .open_repository import show_open_repository_dialog
-from .message import show_message_dialog, MessageType
-from .confirm import show_confirm_dialog
-from .file_picker import show_file_picker_dialog
-from .file_history import show_file_history_dialog
-from .logs import show_logs_dialog
-
-__all__ = [
-    'show_push_dialog',
-    'show_pull_dialog',
-    'show_fetch_dialog',
-    'show_add_remote_dialog',
-    'show_rename_remote_dialog',
-    'show_delete_remote_dialog',
-    'show_list_remotes_dialog',
-    'show_create_branch_dialog',
-    'show_checkout_branch_dialog',
-    'show_rename_branch_dialog',
-    'show_delete_branch_dialog',
-    'show_reset_branch_dialog',
-    'show_merge_dialog',
-    'show_rebase_dialog',
-    'show_database_statistics_dialog',
-    'show_compress_database_dialog',
-    'show_verify_database_dialog',
-    'show_ssh_key_dialog',
-    'show_about_dialog',
-    'show_open_repository_dialog',
-    'show_message_dialog',
-    'MessageType',
-    'show_confirm_dialog',
-    'show_file_picker_dialog',
-    'show_file_history_dialog',
-    'show_logs_dialog',
-]
+"""Dialog modules for Git GUI GTK.
+
+Dialog modules are imported on first use of one of their functions, so
+starting the application does not load dialogs that are never opened.
+"""
+
+import importlib
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    'show_push_dialog': 'push',
+    'show_pull_dialog': 'pull',
+    'show_fetch_dialog': 'fetch',
+    'show_add_remote_dialog': 'add_remote',
+    'show_rename_remote_dialog': 'rename_remote',
+    'show_delete_remote_dialog': 'delete_remote',
+    'show_list_remotes_dialog': 'list_remotes',
+    'show_create_branch_dialog': 'create_branch',
+    'show_checkout_branch_dialog': 'checkout_branch',
+    'show_rename_branch_dialog': 'rename_branch',
+    'show_delete_branch_dialog': 'delete_branch',
+    'show_reset_branch_dialog': 'reset_branch',
+    'show_merge_dialog': 'merge',
+    'show_rebase_dialog': 'rebase',
+    'show_database_statistics_dialog': 'database',
+    'show_compress_database_dialog': 'database',
+    'show_verify_database_dialog': 'database',
+    'show_ssh_key_dialog': 'ssh_key',
+    'show_about_dialog': 'about',
+    'show_open_repository_dialog': 'open_repository',
+    'show_message_dialog': 'message',
+    'MessageType': 'message',
+    'show_confirm_dialog': 'confirm',
+    'show_busy_dialog': 'busy',
+    'show_file_picker_dialog': 'file_picker',
+    'show_file_history_dialog': 'file_history',
+    'show_logs_dialog': 'logs',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module('.' + module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
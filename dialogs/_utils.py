@@ -0,0 +1,206 @@
+"""Shared helpers for building dialogs (not exported)."""
+
+import os
+
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk
+
+from config import UIConfig
+
+# Directory holding the Gtk.Builder .ui files
+_UI_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'ui')
+
+# Dialogs kept for reuse across windows, keyed by name
+_DIALOG_POOL = {}
+# Pooled dialog name -> 'response' handler id of the use awaiting an answer
+_RESPONSE_HANDLERS = {}
+
+
+def set_margins(widget, margin):
+    """Set the same margin on all four sides of a widget."""
+    widget.set_margin_start(margin)
+    widget.set_margin_end(margin)
+    widget.set_margin_top(margin)
+    widget.set_margin_bottom(margin)
+
+
+def create_dialog(parent, title, ok_label=None, destructive=False,
+                  width=UIConfig.DIALOG_WIDTH, height=-1):
+    """Create a modal dialog with standard buttons and a padded content area.
+
+    Args:
+        parent: Parent window
+        title: Dialog title
+        ok_label: Label for the OK button, or None for a single Close button
+        destructive: If True, style the OK button as a destructive action
+        width: Default width
+        height: Default height (-1 for natural height)
+
+    Returns:
+        Tuple of (dialog, content_area)
+    """
+    dialog = Gtk.Dialog(
+        title=title,
+        transient_for=parent,
+        modal=True
+    )
+    dialog.set_default_size(width, height)
+
+    if ok_label:
+        dialog.add_buttons(
+            '_Cancel', Gtk.ResponseType.CANCEL,
+            ok_label, Gtk.ResponseType.OK
+        )
+        if destructive:
+            ok_button = dialog.get_widget_for_response(Gtk.ResponseType.OK)
+            ok_button.get_style_context().add_class('destructive-action')
+    else:
+        dialog.add_buttons('_Close', Gtk.ResponseType.CLOSE)
+
+    content = dialog.get_content_area()
+    set_margins(content, 12)
+    content.set_spacing(6)
+
+    return dialog, content
+
+
+def load_ui(filename):
+    """Load a Gtk.Builder from a file in the ui/ directory."""
+    builder = Gtk.Builder()
+    builder.add_from_file(os.path.join(_UI_DIR, filename))
+    return builder
+
+
+def create_text_combo(items, active_item=None):
+    """Create a ComboBox over a pre-filled single-column ListStore.
+
+    The store is filled before it is attached to the combo, so large lists
+    are populated in one pass without per-item combo updates.
+
+    Args:
+        items: Iterable of strings
+        active_item: Item to select initially (defaults to the first item)
+
+    Returns:
+        The Gtk.ComboBox
+    """
+    store = Gtk.ListStore(str)
+    active_index = 0
+    for i, item in enumerate(items):
+        store.insert_with_valuesv(-1, [0], [item])
+        if item == active_item:
+            active_index = i
+
+    combo = Gtk.ComboBox.new_with_model(store)
+    renderer = Gtk.CellRendererText()
+    combo.pack_start(renderer, True)
+    combo.add_attribute(renderer, 'text', 0)
+    if len(store):
+        combo.set_active(active_index)
+    return combo
+
+
+def get_combo_text(combo):
+    """Return the active item of a combo from create_text_combo, or None."""
+    tree_iter = combo.get_active_iter()
+    if tree_iter is None:
+        return None
+    return combo.get_model()[tree_iter][0]
+
+
+def get_pooled_dialog(name, parent, build):
+    """Return the cached widgets of a reusable dialog, building them once.
+
+    One instance per name is shared by all windows; it is re-parented to
+    the requesting window on every call and hidden rather than destroyed
+    between uses.
+
+    Args:
+        name: Key identifying the dialog
+        parent: Parent window
+        build: Callable(parent) returning a tuple whose first item is
+            the Gtk.Dialog, followed by any widgets the caller needs
+
+    Returns:
+        The tuple returned by build
+    """
+    widgets = _DIALOG_POOL.get(name)
+    if widgets is None:
+        widgets = build(parent)
+        widgets[0].connect('delete-event', Gtk.Widget.hide_on_delete)
+        _DIALOG_POOL[name] = widgets
+    else:
+        widgets[0].set_transient_for(parent)
+    return widgets
+
+
+def connect_pooled_response(name, dialog, on_response):
+    """Connect the 'response' handler for the current use of a pooled dialog.
+
+    The handler runs once. A handler left by an earlier use that was never
+    answered (the dialog was shown again while still open) is disconnected
+    first, so only the latest caller receives the response.
+
+    Args:
+        name: Key the dialog was pooled under
+        dialog: The pooled Gtk.Dialog
+        on_response: Callable(dialog, response)
+    """
+    pending = _RESPONSE_HANDLERS.pop(name, None)
+    if pending is not None:
+        dialog.disconnect(pending)
+
+    def handler(dialog, response):
+        dialog.disconnect(_RESPONSE_HANDLERS.pop(name))
+        on_response(dialog, response)
+
+    _RESPONSE_HANDLERS[name] = dialog.connect('response', handler)
+
+
+def create_check_list(items, height=200):
+    """Create a scrollable list of items with a check box per row.
+
+    The store is filled before it is attached to the view, as in
+    create_text_combo.
+
+    Args:
+        items: Iterable of strings
+        height: Minimum content height of the scrolled list
+
+    Returns:
+        Tuple of (widget, get_checked) where widget is the
+        Gtk.ScrolledWindow to pack and get_checked() returns the checked
+        items in list order
+    """
+    store = Gtk.ListStore(bool, str)
+    for item in items:
+        store.insert_with_valuesv(-1, [0, 1], [False, item])
+
+    view = Gtk.TreeView(model=store)
+    view.set_headers_visible(False)
+
+    toggle = Gtk.CellRendererToggle()
+
+    def on_toggled(renderer, path):
+        store[path][0] = not store[path][0]
+
+    toggle.connect('toggled', on_toggled)
+    view.append_column(Gtk.TreeViewColumn('', toggle, active=0))
+    view.append_column(Gtk.TreeViewColumn('', Gtk.CellRendererText(), text=1))
+
+    def on_row_activated(view, path, column):
+        store[path][0] = not store[path][0]
+
+    view.connect('row-activated', on_row_activated)
+
+    scrolled = Gtk.ScrolledWindow()
+    scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+    scrolled.set_shadow_type(Gtk.ShadowType.IN)
+    scrolled.set_min_content_height(height)
+    scrolled.add(view)
+
+    def get_checked():
+        return [row[1] for row in store if row[0]]
+
+    return scrolled, get_checked
@@ -4,78 +4,90 @@ import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk
 
+import gitops
 from config import UIConfig
+from utils import is_valid_remote_name, is_valid_remote_url
+from ._utils import connect_pooled_response, get_pooled_dialog, load_ui
 
 
-def show_add_remote_dialog(parent, repo):
-    """Show dialog to add a new remote.
+def _build_dialog(parent):
+    """Build the add remote dialog; returned widgets are reused across opens."""
+    builder = load_ui('add_remote.ui')
+    dialog = builder.get_object('dialog')
+    dialog.set_transient_for(parent)
+    dialog.set_default_size(UIConfig.REMOTE_DIALOG_WIDTH, -1)
 
-    Args:
-        parent: Parent window
-        repo: Git repository object (unused, kept for consistency)
+    add_button = builder.get_object('add_button')
+    name_entry = builder.get_object('name_entry')
+    url_entry = builder.get_object('url_entry')
+    validation_label = builder.get_object('validation_label')
+    fetch_check = builder.get_object('fetch_check')
 
-    Returns:
-        Tuple of (name, url, fetch_immediately) or None if cancelled
-    """
-    dialog = Gtk.Dialog(
-        title='Add Remote',
-        transient_for=parent,
-        modal=True
-    )
-    dialog.add_buttons(
-        Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
-        'Add', Gtk.ResponseType.OK
-    )
-    dialog.set_default_size(UIConfig.REMOTE_DIALOG_WIDTH, -1)
+    # Names of existing remotes, refreshed on each open
+    existing = set()
 
-    add_button = dialog.get_widget_for_response(Gtk.ResponseType.OK)
-    add_button.set_sensitive(False)
+    def validate(widget=None):
+        """Validate name and URL and update UI accordingly."""
+        name = name_entry.get_text().strip()
+        url = url_entry.get_text().strip()
 
-    content = dialog.get_content_area()
-    content.set_margin_start(12)
-    content.set_margin_end(12)
-    content.set_margin_top(12)
-    content.set_margin_bottom(12)
-    content.set_spacing(6)
+        if not name or not url:
+            error = ''
+        elif not is_valid_remote_name(name):
+            error = 'Invalid remote name'
+        elif name in existing:
+            error = 'Remote already exists'
+        elif not is_valid_remote_url(url):
+            error = 'Invalid remote URL'
+        else:
+            error = None
 
-    name_label = Gtk.Label(label='Remote name:')
-    name_label.set_xalign(0)
-    content.pack_start(name_label, False, False, 0)
+        add_button.set_sensitive(error is None)
+        validation_label.set_markup(
+            '<span size="small" foreground="red">{}</span>'.format(error or '')
+        )
 
-    name_entry = Gtk.Entry()
-    name_entry.set_text('origin')
-    content.pack_start(name_entry, False, False, 0)
+    name_entry.connect('changed', validate)
+    url_entry.connect('changed', validate)
 
-    url_label = Gtk.Label(label='Remote URL:')
-    url_label.set_xalign(0)
-    content.pack_start(url_label, False, False, 0)
+    return dialog, name_entry, url_entry, fetch_check, existing, validate
 
-    url_entry = Gtk.Entry()
-    url_entry.set_activates_default(True)
-    url_entry.set_placeholder_text('https://github.com/user/repo.git')
-    content.pack_start(url_entry, False, False, 0)
 
-    def on_url_changed(entry):
-        """Enable Add button only if URL is not empty."""
-        add_button.set_sensitive(bool(entry.get_text().strip()))
+def show_add_remote_dialog(parent, repo, on_done, remotes=None):
+    """Show dialog to add a new remote without blocking the main loop.
 
-    url_entry.connect('changed', on_url_changed)
+    Args:
+        parent: Parent window
+        repo: Git repository object
+        on_done: Called with (name, url, fetch_immediately) when the user
+            confirms; not called if the dialog is cancelled
+        remotes: Existing remote names (queried from repo if None)
+    """
+    dialog, name_entry, url_entry, fetch_check, existing, validate = get_pooled_dialog(
+        'add_remote', parent, _build_dialog
+    )
 
-    content.pack_start(Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL), False, False, 6)
+    if remotes is None:
+        remotes = gitops.get_remotes(repo)
+    existing.clear()
+    existing.update(remotes)
 
-    fetch_check = Gtk.CheckButton(label='Fetch Immediately')
+    # Reset fields left over from the previous use
+    name_entry.set_text('origin')
+    url_entry.set_text('')
     fetch_check.set_active(False)
-    content.pack_start(fetch_check, False, False, 0)
+    validate()
+    name_entry.grab_focus()
 
-    dialog.set_default_response(Gtk.ResponseType.OK)
-    dialog.show_all()
+    def on_response(dialog, response):
+        name = name_entry.get_text().strip()
+        url = url_entry.get_text().strip()
+        fetch_after = fetch_check.get_active()
+        dialog.hide()
 
-    response = dialog.run()
-    name = name_entry.get_text().strip()
-    url = url_entry.get_text().strip()
-    fetch_after = fetch_check.get_active()
-    dialog.destroy()
+        if (response == Gtk.ResponseType.OK and is_valid_remote_name(name)
+                and name not in existing and is_valid_remote_url(url)):
+            on_done((name, url, fetch_after))
 
-    if response == Gtk.ResponseType.OK and name and url:
-        return (name, url, fetch_after)
-    return None
+    connect_pooled_response('add_remote', dialog, on_response)
+    dialog.present()
@@ -0,0 +1,41 @@
+"""Busy indicator dialog for long-running operations."""
+
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk
+
+from ._utils import set_margins
+
+
+def show_busy_dialog(parent, title, text):
+    """Show a non-modal dialog with a spinner while an operation runs.
+
+    The dialog has no buttons and cannot be closed by the user; the
+    caller destroys it when the operation completes.
+
+    Args:
+        parent: Parent window
+        title: Dialog title
+        text: Message shown next to the spinner
+
+    Returns:
+        The Gtk.Dialog
+    """
+    dialog = Gtk.Dialog(title=title, transient_for=parent)
+    dialog.set_deletable(False)
+    dialog.set_resizable(False)
+
+    content = dialog.get_content_area()
+    set_margins(content, 20)
+
+    box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+    spinner = Gtk.Spinner()
+    spinner.start()
+    box.pack_start(spinner, False, False, 0)
+    label = Gtk.Label(label=text)
+    label.set_xalign(0)
+    box.pack_start(label, True, True, 0)
+    content.pack_start(box, False, False, 0)
+
+    dialog.show_all()
+    return dialog
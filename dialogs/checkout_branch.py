@@ -5,46 +5,33 @@ gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk
 
 import gitops
-from config import UIConfig
+from ._utils import create_dialog
 
 
-def show_checkout_branch_dialog(parent, repo):
+def show_checkout_branch_dialog(parent, repo, branches=None, current_branch=None):
     """Show dialog to checkout a branch.
 
     Args:
         parent: Parent window
         repo: Git repository object
+        branches: Local branch names (queried from repo if None)
+        current_branch: Current branch name (queried from repo if None)
 
     Returns:
         Branch/tag name to checkout or None if cancelled
     """
     # Fetch data
-    local_branches = gitops.get_branches(repo)
+    local_branches = branches if branches is not None else gitops.get_branches(repo)
     tracking_branches = gitops.get_tracking_branches(repo)
     tags = gitops.get_tags(repo)
-    current_branch = gitops.get_current_branch(repo)
+    if current_branch is None:
+        current_branch = gitops.get_current_branch(repo)
 
     # Check if there's anything to checkout
     if not local_branches and not tracking_branches and not tags:
         return None
 
-    dialog = Gtk.Dialog(
-        title='Checkout',
-        transient_for=parent,
-        modal=True
-    )
-    dialog.set_default_size(UIConfig.DIALOG_WIDTH, 400)
-    dialog.add_buttons(
-        Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
-        'Checkout', Gtk.ResponseType.OK
-    )
-
-    content = dialog.get_content_area()
-    content.set_margin_start(12)
-    content.set_margin_end(12)
-    content.set_margin_top(12)
-    content.set_margin_bottom(12)
-    content.set_spacing(6)
+    dialog, content = create_dialog(parent, 'Checkout', 'Checkout', height=400)
 
     # Type selection label
     type_label = Gtk.Label(label='Checkout:')
@@ -6,33 +6,45 @@ gi.require_version('Gtk', '3.0')
 
 from gi.repository import Gtk
 
+from ._utils import connect_pooled_response, get_pooled_dialog
 
-def show_confirm_dialog(parent, title, detail, confirm_label):
-    """Show a modal confirmation dialog with a destructive action button.
 
-    Args:
-        parent: Parent Gtk.Window.
-        title: Primary text shown as bold heading.
-        detail: Secondary text with details.
-        confirm_label: Label for the confirm button (e.g. 'Revert').
-
-    Returns:
-        True if the user confirmed, False otherwise.
-    """
+def _build_dialog(parent):
+    """Build the confirmation dialog; reused across calls."""
     dialog = Gtk.MessageDialog(
         transient_for=parent,
         modal=True,
         message_type=Gtk.MessageType.WARNING,
         buttons=Gtk.ButtonsType.NONE,
-        text=title,
     )
-    dialog.format_secondary_text(detail)
     dialog.add_button('Cancel', Gtk.ResponseType.CANCEL)
-    dialog.add_button(confirm_label, Gtk.ResponseType.OK)
-
-    confirm_btn = dialog.get_widget_for_response(Gtk.ResponseType.OK)
+    confirm_btn = dialog.add_button('', Gtk.ResponseType.OK)
     confirm_btn.get_style_context().add_class('destructive-action')
+    return dialog, confirm_btn
+
+
+def show_confirm_dialog(parent, title, detail, confirm_label, on_confirm):
+    """Show a modal confirmation dialog without blocking the main loop.
+
+    Args:
+        parent: Parent Gtk.Window.
+        title: Primary text shown as bold heading.
+        detail: Secondary text with details.
+        confirm_label: Label for the confirm button (e.g. 'Revert').
+        on_confirm: Called with no arguments if the user confirms; not
+            called if the dialog is cancelled.
+    """
+    dialog, confirm_btn = get_pooled_dialog('confirm', parent, _build_dialog)
+
+    dialog.set_property('text', title)
+    dialog.format_secondary_text(detail)
+    confirm_btn.set_label(confirm_label)
+    dialog.set_default_response(Gtk.ResponseType.CANCEL)
+
+    def on_response(dialog, response):
+        dialog.hide()
+        if response == Gtk.ResponseType.OK:
+            on_confirm()
 
-    response = dialog.run()
-    dialog.destroy()
-    return response == Gtk.ResponseType.OK
+    connect_pooled_response('confirm', dialog, on_response)
+    dialog.present()
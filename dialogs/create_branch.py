@@ -5,41 +5,27 @@ gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk
 
 import gitops
-from config import UIConfig
 from utils import is_valid_branch_name
+from ._utils import create_dialog
 
 
-def show_create_branch_dialog(parent, repo):
+def show_create_branch_dialog(parent, repo, branches=None, current_branch=None):
     """Show dialog to create a new branch.
 
     Args:
         parent: Parent window
         repo: Git repository object
+        branches: Local branch names (queried from repo if None)
+        current_branch: Current branch name (queried from repo if None)
 
     Returns:
         Tuple of (branch_name, base, checkout) or None if cancelled
     """
-    dialog = Gtk.Dialog(
-        title='Create Branch',
-        transient_for=parent,
-        modal=True
-    )
-    dialog.set_default_size(UIConfig.DIALOG_WIDTH, 400)
-    dialog.add_buttons(
-        Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
-        'Create', Gtk.ResponseType.OK
-    )
+    dialog, content = create_dialog(parent, 'Create Branch', 'Create', height=400)
 
     create_button = dialog.get_widget_for_response(Gtk.ResponseType.OK)
     create_button.set_sensitive(False)
 
-    content = dialog.get_content_area()
-    content.set_margin_start(12)
-    content.set_margin_end(12)
-    content.set_margin_top(12)
-    content.set_margin_bottom(12)
-    content.set_spacing(6)
-
     # Branch name
     name_label = Gtk.Label(label='Branch name:')
     name_label.set_xalign(0)
@@ -71,10 +57,11 @@ def show_create_branch_dialog(parent, repo):
     content.pack_start(radio_box, False, False, 0)
 
     # Fetch data
-    local_branches = gitops.get_branches(repo)
+    local_branches = branches if branches is not None else gitops.get_branches(repo)
     tracking_branches = gitops.get_tracking_branches(repo)
     tags = gitops.get_tags(repo)
-    current_branch = gitops.get_current_branch(repo)
+    if current_branch is None:
+        current_branch = gitops.get_current_branch(repo)
 
     # ListBox for base selection in a scrolled window
     scrolled = Gtk.ScrolledWindow()
@@ -2,9 +2,8 @@
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GLib
+from gi.repository import Gtk
 
-import threading
 import gitops
 
 
@@ -39,16 +38,15 @@ def show_database_statistics_dialog(parent, repo):
     return False
 
 
-def show_compress_database_dialog(parent, repo, on_complete=None):
-    """Show compress database dialog with progress.
+def _show_progress_dialog(parent, title, text):
+    """Show a modal dialog with a spinner while a long operation runs.
 
-    Args:
-        parent: Parent window
-        repo: Git repository object
-        on_complete: Optional callback(success, message) when complete
+    Returns:
+        Callable finish(result_text) that replaces the spinner with
+        result_text and adds a Close button; call it on the main thread
     """
     dialog = Gtk.Dialog(
-        title='Compress Database',
+        title=title,
         transient_for=parent,
         modal=True
     )
@@ -62,7 +60,7 @@ def show_compress_database_dialog(parent, repo, on_complete=None):
     content.set_margin_bottom(12)
     content.set_spacing(12)
 
-    label = Gtk.Label(label='Compressing database...')
+    label = Gtk.Label(label=text)
     label.set_xalign(0)
     content.pack_start(label, False, False, 0)
 
@@ -72,14 +70,10 @@ def show_compress_database_dialog(parent, repo, on_complete=None):
 
     dialog.show_all()
 
-    def on_compress_complete(success, message):
+    def finish(result_text):
         spinner.stop()
         spinner.hide()
-
-        if success:
-            label.set_text('Database compressed successfully.')
-        else:
-            label.set_text(f'Compression failed: {message}')
+        label.set_text(result_text)
 
         button_box = dialog.get_action_area()
         button_box.set_layout(Gtk.ButtonBoxStyle.END)
@@ -89,81 +83,82 @@ def show_compress_database_dialog(parent, repo, on_complete=None):
         dialog.set_deletable(True)
         button_box.show_all()
 
-        dialog.run()
-        dialog.destroy()
+        # Closing must not block the main loop either
+        dialog.connect('response', lambda d, r: d.destroy())
 
-        if on_complete:
-            on_complete(success, message)
-
-    def do_compress():
-        success, message = gitops.compress_database(repo)
-        GLib.idle_add(on_compress_complete, success, message)
+    return finish
 
-    thread = threading.Thread(target=do_compress)
-    thread.daemon = True
-    thread.start()
 
+def show_compress_database_dialog(parent, repo):
+    """Show compress database dialog with progress.
 
-def show_verify_database_dialog(parent, repo, on_complete=None):
-    """Show verify database dialog with progress and result.
+    The dialog does not run git gc itself; the caller runs the returned
+    operation in the background and passes its result to finish.
 
     Args:
         parent: Parent window
         repo: Git repository object
-        on_complete: Optional callback(success, message) when complete
+
+    Returns:
+        Tuple of (operation, finish): operation() returns (success,
+        status) with a one-line status and is safe to call from a worker
+        thread; finish(success, status) shows the full result on the main
+        thread
     """
-    dialog = Gtk.Dialog(
-        title='Verify Database',
-        transient_for=parent,
-        modal=True
+    show_result = _show_progress_dialog(
+        parent, 'Compress Database', 'Compressing database...'
     )
-    dialog.set_default_size(350, 120)
-    dialog.set_deletable(False)
+    # Full git output, kept out of the status bar
+    output = []
 
-    content = dialog.get_content_area()
-    content.set_margin_start(20)
-    content.set_margin_end(20)
-    content.set_margin_top(20)
-    content.set_margin_bottom(12)
-    content.set_spacing(12)
-
-    label = Gtk.Label(label='Verifying database...')
-    label.set_xalign(0)
-    content.pack_start(label, False, False, 0)
+    def operation():
+        success, message = gitops.compress_database(repo)
+        output.append(message)
+        return success, ('Database compressed' if success
+                         else 'Database compression failed')
 
-    spinner = Gtk.Spinner()
-    spinner.start()
-    content.pack_start(spinner, False, False, 0)
+    def finish(success, status):
+        if success:
+            show_result('Database compressed successfully.')
+        else:
+            show_result(f'Compression failed: {output[0] if output else status}')
 
-    dialog.show_all()
+    return operation, finish
 
-    def on_verify_complete(success, message):
-        spinner.stop()
-        spinner.hide()
 
-        if success:
-            label.set_text(message if message else 'No errors found.')
-        else:
-            label.set_text(f'Verification failed: {message}')
+def show_verify_database_dialog(parent, repo):
+    """Show verify database dialog with progress and result.
 
-        button_box = dialog.get_action_area()
-        button_box.set_layout(Gtk.ButtonBoxStyle.END)
-        button_box.set_margin_end(12)
-        button_box.set_margin_bottom(12)
-        dialog.add_button('Close', Gtk.ResponseType.CLOSE)
-        dialog.set_deletable(True)
-        button_box.show_all()
+    The dialog does not run git fsck itself; the caller runs the returned
+    operation in the background and passes its result to finish.
 
-        dialog.run()
-        dialog.destroy()
+    Args:
+        parent: Parent window
+        repo: Git repository object
 
-        if on_complete:
-            on_complete(success, message)
+    Returns:
+        Tuple of (operation, finish): operation() returns (success,
+        status) with a one-line status and is safe to call from a worker
+        thread; finish(success, status) shows the full fsck output on the
+        main thread
+    """
+    show_result = _show_progress_dialog(
+        parent, 'Verify Database', 'Verifying database...'
+    )
+    # Full git output, kept out of the status bar
+    output = []
 
-    def do_verify():
+    def operation():
         success, message = gitops.verify_database(repo)
-        GLib.idle_add(on_verify_complete, success, message)
+        output.append(message)
+        return success, ('Database verification completed' if success
+                         else 'Database verification found issues')
+
+    def finish(success, status):
+        message = output[0] if output else status
+        if success:
+            show_result(message if message else 'No errors found.')
+        else:
+            show_result(f'Verification failed: {message}')
 
-    thread = threading.Thread(target=do_verify)
-    thread.daemon = True
-    thread.start()
+    return operation, finish
@@ -6,81 +6,62 @@ from gi.repository import Gtk
 
 import gitops
 from config import UIConfig
+from ._utils import create_check_list, create_dialog
 
 
-def _get_default_remote_index(repo, remotes):
-    """Get the index of the default remote (tracking remote or first)."""
-    tracking_remote = gitops.get_tracking_remote(repo)
-    if tracking_remote and tracking_remote in remotes:
-        return remotes.index(tracking_remote)
-    return 0
-
-
-def show_delete_remote_dialog(parent, repo):
-    """Show dialog to delete a remote.
+def show_delete_remote_dialog(parent, repo, remotes=None):
+    """Show dialog to delete one or more remotes.
 
     Args:
         parent: Parent window
         repo: Git repository object
+        remotes: Remote names (queried from repo if None)
 
     Returns:
-        Remote name to delete or None if cancelled
+        List of remote names to delete or None if cancelled
     """
-    remotes = gitops.get_remotes(repo)
+    if remotes is None:
+        remotes = gitops.get_remotes(repo)
     if not remotes:
         return None
 
-    dialog = Gtk.Dialog(
-        title='Delete Remote',
-        transient_for=parent,
-        modal=True
-    )
-    dialog.add_buttons(
-        Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
-        'Delete', Gtk.ResponseType.OK
+    dialog, content = create_dialog(
+        parent, 'Delete Remote', 'Delete', destructive=True,
+        width=UIConfig.REMOTE_DIALOG_WIDTH
     )
-    dialog.set_default_size(UIConfig.REMOTE_DIALOG_WIDTH, -1)
-
-    delete_button = dialog.get_widget_for_response(Gtk.ResponseType.OK)
-    delete_button.get_style_context().add_class('destructive-action')
-
-    content = dialog.get_content_area()
-    content.set_margin_start(12)
-    content.set_margin_end(12)
-    content.set_margin_top(12)
-    content.set_margin_bottom(12)
-    content.set_spacing(6)
 
     # Remote selection
-    remote_label = Gtk.Label(label='Remote to delete:')
+    remote_label = Gtk.Label(label='Remotes to delete:')
     remote_label.set_xalign(0)
     content.pack_start(remote_label, False, False, 0)
 
-    remote_combo = Gtk.ComboBoxText()
-    for remote in remotes:
-        remote_combo.append_text(remote)
-    remote_combo.set_active(_get_default_remote_index(repo, remotes))
-    content.pack_start(remote_combo, False, False, 0)
+    remote_list, get_checked = create_check_list(remotes, height=120)
+    content.pack_start(remote_list, True, True, 0)
 
     dialog.set_default_response(Gtk.ResponseType.CANCEL)
     dialog.show_all()
 
     response = dialog.run()
-    selected_remote = remote_combo.get_active_text()
+    selected_remotes = get_checked()
     dialog.destroy()
 
-    if response == Gtk.ResponseType.OK and selected_remote:
+    if response == Gtk.ResponseType.OK and selected_remotes:
+        if len(selected_remotes) == 1:
+            text = f'Delete remote "{selected_remotes[0]}"?'
+        else:
+            text = f'Delete {len(selected_remotes)} remotes?'
+
         # Show confirmation dialog
         confirm = Gtk.MessageDialog(
             transient_for=parent,
             modal=True,
             message_type=Gtk.MessageType.WARNING,
             buttons=Gtk.ButtonsType.NONE,
-            text=f'Delete remote "{selected_remote}"?'
+            text=text
         )
         confirm.format_secondary_text(
-            'This will remove the remote and all its tracking branches. '
-            'This action cannot be undone.'
+            '{}\n\nThis will remove the remotes and all their tracking branches. '
+            'This action cannot be undone.'.format('\n'.join(selected_remotes))
         )
         confirm.add_button('Cancel', Gtk.ResponseType.CANCEL)
         confirm.add_button('Delete', Gtk.ResponseType.OK)
@@ -92,6 +73,6 @@ def show_delete_remote_dialog(parent, repo):
         confirm.destroy()
 
         if confirm_response == Gtk.ResponseType.OK:
-            return selected_remote
+            return selected_remotes
 
     return None
@@ -8,25 +8,30 @@ import gitops
 from config import UIConfig
 
 
-def _get_default_remote_index(repo, remotes):
+def _get_default_remote_index(repo, remotes, tracking_remote=None):
     """Get the index of the default remote (tracking remote or first)."""
-    tracking_remote = gitops.get_tracking_remote(repo)
+    if tracking_remote is None:
+        tracking_remote = gitops.get_tracking_remote(repo)
     if tracking_remote and tracking_remote in remotes:
         return remotes.index(tracking_remote)
     return 0
 
 
-def show_fetch_dialog(parent, repo):
+def show_fetch_dialog(parent, repo, remotes=None, tracking_remote=None):
     """Show dialog to fetch from a remote.
 
     Args:
         parent: Parent window
         repo: Git repository object
+        remotes: Remote names (queried from repo if None)
+        tracking_remote: Remote tracked by the current branch, '' if none
+            (queried from repo if None)
 
     Returns:
         Remote name or None if cancelled
     """
-    remotes = gitops.get_remotes(repo)
+    if remotes is None:
+        remotes = gitops.get_remotes(repo)
     if not remotes:
         return None
 
@@ -37,7 +42,7 @@ def show_fetch_dialog(parent, repo):
     )
     dialog.set_default_size(UIConfig.REMOTE_DIALOG_WIDTH, -1)
     dialog.add_buttons(
-        Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
+        '_Cancel', Gtk.ResponseType.CANCEL,
         'Fetch', Gtk.ResponseType.OK
     )
 
@@ -55,7 +60,7 @@ def show_fetch_dialog(parent, repo):
     combo = Gtk.ComboBoxText()
     for remote in remotes:
         combo.append_text(remote)
-    combo.set_active(_get_default_remote_index(repo, remotes))
+    combo.set_active(_get_default_remote_index(repo, remotes, tracking_remote))
     content.pack_start(combo, False, False, 0)
 
     dialog.set_default_response(Gtk.ResponseType.OK)
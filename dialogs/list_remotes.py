@@ -2,10 +2,11 @@
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
+from gi.repository import Gtk, Pango
 
 import gitops
 from config import UIConfig
+from ._utils import create_dialog
 
 
 def show_list_remotes_dialog(parent, repo):
@@ -17,20 +18,9 @@ def show_list_remotes_dialog(parent, repo):
     """
     remotes = gitops.get_remotes_with_urls(repo)
 
-    dialog = Gtk.Dialog(
-        title='Remotes',
-        transient_for=parent,
-        modal=True
+    dialog, content = create_dialog(
+        parent, 'Remotes', width=UIConfig.REMOTE_DIALOG_WIDTH, height=200
     )
-    dialog.add_buttons(Gtk.STOCK_CLOSE, Gtk.ResponseType.CLOSE)
-    dialog.set_default_size(UIConfig.REMOTE_DIALOG_WIDTH, 200)
-
-    content = dialog.get_content_area()
-    content.set_margin_start(12)
-    content.set_margin_end(12)
-    content.set_margin_top(12)
-    content.set_margin_bottom(12)
-    content.set_spacing(6)
 
     if not remotes:
         label = Gtk.Label(label='No remotes configured.')
@@ -40,24 +30,32 @@ def show_list_remotes_dialog(parent, repo):
         scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         scrolled.set_vexpand(True)
 
-        # Create list store: name, url
+        # Create list store: name, url (filled before it is attached)
         store = Gtk.ListStore(str, str)
         for name, url in remotes.items():
-            store.append([name, url])
+            store.insert_with_valuesv(-1, [0, 1], [name, url])
 
-        tree_view = Gtk.TreeView(model=store)
+        # Fixed-height rows let the view skip measuring every row
+        tree_view = Gtk.TreeView()
         tree_view.set_headers_visible(True)
 
         name_renderer = Gtk.CellRendererText()
         name_column = Gtk.TreeViewColumn('Name', name_renderer, text=0)
-        name_column.set_min_width(100)
+        name_column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+        name_column.set_fixed_width(100)
+        name_column.set_resizable(True)
         tree_view.append_column(name_column)
 
         url_renderer = Gtk.CellRendererText()
+        url_renderer.set_property('ellipsize', Pango.EllipsizeMode.MIDDLE)
         url_column = Gtk.TreeViewColumn('URL', url_renderer, text=1)
+        url_column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
         url_column.set_expand(True)
         tree_view.append_column(url_column)
 
+        tree_view.set_fixed_height_mode(True)
+        tree_view.set_model(store)
+
         scrolled.add(tree_view)
         content.pack_start(scrolled, True, True, 0)
 
@@ -8,20 +8,23 @@ import gitops
 from config import UIConfig
 
 
-def show_merge_dialog(parent, repo):
+def show_merge_dialog(parent, repo, branches=None, current_branch=None):
     """Show dialog to merge a branch.
 
     Args:
         parent: Parent window
         repo: Git repository object
+        branches: Local branch names (queried from repo if None)
+        current_branch: Current branch name (queried from repo if None)
 
     Returns:
         Tuple of (branch, strategy) or None if cancelled.
         Strategy is one of: 'default', 'no-ff', 'ff-only', 'squash'
     """
     # Fetch data
-    current_branch = gitops.get_current_branch(repo)
-    local_branches = gitops.get_branches(repo)
+    if current_branch is None:
+        current_branch = gitops.get_current_branch(repo)
+    local_branches = branches if branches is not None else gitops.get_branches(repo)
     # Filter out current branch from local branches
     local_branches = [b for b in local_branches if b != current_branch]
     tracking_branches = gitops.get_tracking_branches(repo)
@@ -38,7 +41,7 @@ def show_merge_dialog(parent, repo):
     )
     dialog.set_default_size(UIConfig.DIALOG_WIDTH, 400)
     dialog.add_buttons(
-        Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
+        '_Cancel', Gtk.ResponseType.CANCEL,
         'Merge', Gtk.ResponseType.OK
     )
 
@@ -35,7 +35,9 @@ _MSG_TYPE_TITLE = {
 }
 
 def show_message_dialog(parent, title, message, msg_type=MessageType.INFO):
-    """Show a modal message dialog.
+    """Show a modal message dialog without blocking the main loop.
+
+    The dialog destroys itself when closed.
 
     Args:
         parent: Parent Gtk.Window.
@@ -62,5 +64,5 @@ def show_message_dialog(parent, title, message, msg_type=MessageType.INFO):
     button_box.set_margin_bottom(12)
 
     dialog.add_button('Close', Gtk.ResponseType.CLOSE)
-    dialog.run()
-    dialog.destroy()
+    dialog.connect('response', lambda d, response: d.destroy())
+    dialog.show()
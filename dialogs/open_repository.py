@@ -6,35 +6,42 @@ import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk
 
+# Initial folder when no repository is open
+_DEFAULT_FOLDER = os.path.expanduser('~')
 
-def show_open_repository_dialog(parent, current_repo_path=None):
-    """Show dialog to open a repository.
+
+def show_open_repository_dialog(parent, on_done, current_repo_path=None):
+    """Show dialog to open a repository without blocking the main loop.
 
     Args:
         parent: Parent window
+        on_done: Called with the selected folder path when the user
+            confirms; not called if the dialog is cancelled
         current_repo_path: Current repository path for initial folder (optional)
-
-    Returns:
-        Selected folder path or None if cancelled
     """
     dialog = Gtk.FileChooserDialog(
         title='Open Git Repository',
         parent=parent,
-        action=Gtk.FileChooserAction.SELECT_FOLDER
+        action=Gtk.FileChooserAction.SELECT_FOLDER,
+        modal=True
     )
     dialog.add_buttons(
-        Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
-        Gtk.STOCK_OPEN, Gtk.ResponseType.OK
+        '_Cancel', Gtk.ResponseType.CANCEL,
+        '_Open', Gtk.ResponseType.OK
     )
 
+    # Local folders only, and no hidden entries to enumerate
+    dialog.set_local_only(True)
+    dialog.set_show_hidden(False)
+
     # Set initial folder
-    if current_repo_path:
-        dialog.set_current_folder(current_repo_path)
-    else:
-        dialog.set_current_folder(os.path.expanduser('~'))
+    dialog.set_current_folder(current_repo_path or _DEFAULT_FOLDER)
 
-    response = dialog.run()
-    selected_path = dialog.get_filename() if response == Gtk.ResponseType.OK else None
-    dialog.destroy()
+    def on_response(dialog, response):
+        selected_path = dialog.get_filename() if response == Gtk.ResponseType.OK else None
+        dialog.destroy()
+        if selected_path:
+            on_done(selected_path)
 
-    return selected_path
+    dialog.connect('response', on_response)
+    dialog.present()
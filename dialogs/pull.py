@@ -8,29 +8,36 @@ import gitops
 from config import UIConfig
 
 
-def _get_default_remote_index(repo, remotes):
+def _get_default_remote_index(repo, remotes, tracking_remote=None):
     """Get the index of the default remote (tracking remote or first)."""
-    tracking_remote = gitops.get_tracking_remote(repo)
+    if tracking_remote is None:
+        tracking_remote = gitops.get_tracking_remote(repo)
     if tracking_remote and tracking_remote in remotes:
         return remotes.index(tracking_remote)
     return 0
 
 
-def show_pull_dialog(parent, repo):
+def show_pull_dialog(parent, repo, remotes=None, tracking_remote=None, current_branch=None):
     """Show dialog to pull from a remote.
 
     Args:
         parent: Parent window
         repo: Git repository object
+        remotes: Remote names (queried from repo if None)
+        tracking_remote: Remote tracked by the current branch, '' if none
+            (queried from repo if None)
+        current_branch: Current branch name (queried from repo if None)
 
     Returns:
         Tuple of (remote, branch, ff_only, rebase) or None if cancelled
     """
-    remotes = gitops.get_remotes(repo)
+    if remotes is None:
+        remotes = gitops.get_remotes(repo)
     if not remotes:
         return None
 
-    current_branch = gitops.get_current_branch(repo)
+    if current_branch is None:
+        current_branch = gitops.get_current_branch(repo)
 
     dialog = Gtk.Dialog(
         title='Pull',
@@ -39,7 +46,7 @@ def show_pull_dialog(parent, repo):
     )
     dialog.set_default_size(UIConfig.REMOTE_DIALOG_WIDTH, -1)
     dialog.add_buttons(
-        Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
+        '_Cancel', Gtk.ResponseType.CANCEL,
         'Pull', Gtk.ResponseType.OK
     )
 
@@ -58,7 +65,7 @@ def show_pull_dialog(parent, repo):
     remote_combo = Gtk.ComboBoxText()
     for remote in remotes:
         remote_combo.append_text(remote)
-    remote_combo.set_active(_get_default_remote_index(repo, remotes))
+    remote_combo.set_active(_get_default_remote_index(repo, remotes, tracking_remote))
     content.pack_start(remote_combo, False, False, 0)
 
     # Branch selection
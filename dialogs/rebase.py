@@ -8,19 +8,22 @@ import gitops
 from config import UIConfig
 
 
-def show_rebase_dialog(parent, repo):
+def show_rebase_dialog(parent, repo, branches=None, current_branch=None):
     """Show dialog to rebase current branch.
 
     Args:
         parent: Parent window
         repo: Git repository object
+        branches: Local branch names (queried from repo if None)
+        current_branch: Current branch name (queried from repo if None)
 
     Returns:
         Branch/tag name to rebase onto or None if cancelled
     """
     # Fetch data
-    current_branch = gitops.get_current_branch(repo)
-    local_branches = gitops.get_branches(repo)
+    if current_branch is None:
+        current_branch = gitops.get_current_branch(repo)
+    local_branches = branches if branches is not None else gitops.get_branches(repo)
     # Filter out current branch from local branches
     local_branches = [b for b in local_branches if b != current_branch]
     tracking_branches = gitops.get_tracking_branches(repo)
@@ -37,7 +40,7 @@ def show_rebase_dialog(parent, repo):
     )
     dialog.set_default_size(UIConfig.DIALOG_WIDTH, 400)
     dialog.add_buttons(
-        Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
+        '_Cancel', Gtk.ResponseType.CANCEL,
         'Rebase', Gtk.ResponseType.OK
     )
 
@@ -5,58 +5,40 @@ gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk
 
 import gitops
-from config import UIConfig
 from utils import is_valid_branch_name
+from ._utils import create_dialog, create_text_combo, get_combo_text
 
 
-def show_rename_branch_dialog(parent, repo):
+def show_rename_branch_dialog(parent, repo, branches=None, current_branch=None):
     """Show dialog to rename a branch.
 
     Args:
         parent: Parent window
         repo: Git repository object
+        branches: Local branch names (queried from repo if None)
+        current_branch: Current branch name (queried from repo if None)
 
     Returns:
         Tuple of (old_name, new_name) or None if cancelled
     """
-    branches = gitops.get_branches(repo)
+    if branches is None:
+        branches = gitops.get_branches(repo)
     if not branches:
         return None
 
-    current_branch = gitops.get_current_branch(repo)
+    if current_branch is None:
+        current_branch = gitops.get_current_branch(repo)
 
-    dialog = Gtk.Dialog(
-        title='Rename Branch',
-        transient_for=parent,
-        modal=True
-    )
-    dialog.set_default_size(UIConfig.DIALOG_WIDTH, -1)
-    dialog.add_buttons(
-        Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
-        'Rename', Gtk.ResponseType.OK
-    )
+    dialog, content = create_dialog(parent, 'Rename Branch', 'Rename')
 
     rename_button = dialog.get_widget_for_response(Gtk.ResponseType.OK)
     rename_button.set_sensitive(False)
 
-    content = dialog.get_content_area()
-    content.set_margin_start(12)
-    content.set_margin_end(12)
-    content.set_margin_top(12)
-    content.set_margin_bottom(12)
-    content.set_spacing(6)
-
     label1 = Gtk.Label(label='Select branch to rename:')
     label1.set_xalign(0)
     content.pack_start(label1, False, False, 0)
 
-    combo = Gtk.ComboBoxText()
-    active_index = 0
-    for i, branch in enumerate(branches):
-        combo.append_text(branch)
-        if branch == current_branch:
-            active_index = i
-    combo.set_active(active_index)
+    combo = create_text_combo(branches, current_branch)
     content.pack_start(combo, False, False, 0)
 
     label2 = Gtk.Label(label='New name:')
@@ -76,7 +58,7 @@ def show_rename_branch_dialog(parent, repo):
     def validate_name(widget):
         """Validate new branch name and update UI accordingly."""
         new_name = entry.get_text().strip()
-        old_name = combo.get_active_text()
+        old_name = get_combo_text(combo)
 
         if not new_name:
             rename_button.set_sensitive(False)
@@ -107,7 +89,7 @@ def show_rename_branch_dialog(parent, repo):
     dialog.show_all()
 
     response = dialog.run()
-    old_name = combo.get_active_text()
+    old_name = get_combo_text(combo)
     new_name = entry.get_text().strip()
     dialog.destroy()
 
@@ -8,25 +8,30 @@ import gitops
 from config import UIConfig
 
 
-def _get_default_remote_index(repo, remotes):
+def _get_default_remote_index(repo, remotes, tracking_remote=None):
     """Get the index of the default remote (tracking remote or first)."""
-    tracking_remote = gitops.get_tracking_remote(repo)
+    if tracking_remote is None:
+        tracking_remote = gitops.get_tracking_remote(repo)
     if tracking_remote and tracking_remote in remotes:
         return remotes.index(tracking_remote)
     return 0
 
 
-def show_rename_remote_dialog(parent, repo):
+def show_rename_remote_dialog(parent, repo, remotes=None, tracking_remote=None):
     """Show dialog to rename a remote.
 
     Args:
         parent: Parent window
         repo: Git repository object
+        remotes: Remote names (queried from repo if None)
+        tracking_remote: Remote tracked by the current branch, '' if none
+            (queried from repo if None)
 
     Returns:
         Tuple of (old_name, new_name) or None if cancelled
     """
-    remotes = gitops.get_remotes(repo)
+    if remotes is None:
+        remotes = gitops.get_remotes(repo)
     if not remotes:
         return None
 
@@ -36,7 +41,7 @@ def show_rename_remote_dialog(parent, repo):
         modal=True
     )
     dialog.add_buttons(
-        Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
+        '_Cancel', Gtk.ResponseType.CANCEL,
         'Rename', Gtk.ResponseType.OK
     )
     dialog.set_default_size(UIConfig.REMOTE_DIALOG_WIDTH, -1)
@@ -59,7 +64,7 @@ def show_rename_remote_dialog(parent, repo):
     remote_combo = Gtk.ComboBoxText()
     for remote in remotes:
         remote_combo.append_text(remote)
-    remote_combo.set_active(_get_default_remote_index(repo, remotes))
+    remote_combo.set_active(_get_default_remote_index(repo, remotes, tracking_remote))
     content.pack_start(remote_combo, False, False, 0)
 
     # New name entry
@@ -6,82 +6,55 @@ from gi.repository import Gtk
 
 import gitops
 from config import UIConfig
+from ._utils import connect_pooled_response, get_pooled_dialog, load_ui
 
 
-def show_reset_branch_dialog(parent, repo):
-    """Show dialog to reset current branch.
+def _build_dialog(parent):
+    """Build the reset branch dialog; returned widgets are reused across opens."""
+    builder = load_ui('reset_branch.ui')
+    dialog = builder.get_object('dialog')
+    dialog.set_transient_for(parent)
+    dialog.set_default_size(UIConfig.DIALOG_WIDTH, -1)
+
+    return (
+        dialog,
+        builder.get_object('info_label'),
+        builder.get_object('target_entry'),
+        builder.get_object('mode_combo'),
+    )
+
+
+def show_reset_branch_dialog(parent, repo, on_done, current_branch=None):
+    """Show dialog to reset current branch without blocking the main loop.
 
     Args:
         parent: Parent window
         repo: Git repository object
-
-    Returns:
-        Tuple of (target, mode) or None if cancelled
-        mode is one of: 'soft', 'mixed', 'hard'
+        on_done: Called with (target, mode) when the user confirms; not
+            called if the dialog is cancelled. mode is one of: 'soft',
+            'mixed', 'hard'
+        current_branch: Current branch name (queried from repo if None)
     """
-    dialog = Gtk.Dialog(
-        title='Reset Branch',
-        transient_for=parent,
-        modal=True
-    )
-    dialog.set_default_size(UIConfig.DIALOG_WIDTH, -1)
-    dialog.add_buttons(
-        Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
-        'Reset', Gtk.ResponseType.OK
+    dialog, info_label, entry, mode_combo = get_pooled_dialog(
+        'reset_branch', parent, _build_dialog
     )
 
-    # Make reset button destructive
-    reset_btn = dialog.get_widget_for_response(Gtk.ResponseType.OK)
-    reset_btn.get_style_context().add_class('destructive-action')
+    if current_branch is None:
+        current_branch = gitops.get_current_branch(repo)
 
-    content = dialog.get_content_area()
-    content.set_margin_start(12)
-    content.set_margin_end(12)
-    content.set_margin_top(12)
-    content.set_margin_bottom(12)
-    content.set_spacing(6)
-
-    current_branch = gitops.get_current_branch(repo)
-    info_label = Gtk.Label(label=f'Reset branch: {current_branch}')
-    info_label.set_xalign(0)
-    content.pack_start(info_label, False, False, 0)
-
-    label = Gtk.Label(label='Reset to (commit/branch/tag):')
-    label.set_xalign(0)
-    content.pack_start(label, False, False, 0)
-
-    entry = Gtk.Entry()
+    # Reset fields left over from the previous use
+    info_label.set_text(f'Reset branch: {current_branch}')
     entry.set_text('HEAD')
-    entry.set_activates_default(True)
-    content.pack_start(entry, False, False, 0)
-
-    mode_label = Gtk.Label(label='Reset mode:')
-    mode_label.set_xalign(0)
-    content.pack_start(mode_label, False, False, 0)
-
-    soft_radio = Gtk.RadioButton.new_with_label(None, 'Soft (keep changes staged)')
-    content.pack_start(soft_radio, False, False, 0)
-
-    mixed_radio = Gtk.RadioButton.new_with_label_from_widget(soft_radio, 'Mixed (keep changes unstaged)')
-    mixed_radio.set_active(True)
-    content.pack_start(mixed_radio, False, False, 0)
-
-    hard_radio = Gtk.RadioButton.new_with_label_from_widget(soft_radio, 'Hard (discard all changes)')
-    content.pack_start(hard_radio, False, False, 0)
+    mode_combo.set_active_id('mixed')
+    entry.grab_focus()
 
-    dialog.set_default_response(Gtk.ResponseType.OK)
-    dialog.show_all()
+    def on_response(dialog, response):
+        target = entry.get_text().strip()
+        mode = mode_combo.get_active_id() or 'mixed'
+        dialog.hide()
 
-    response = dialog.run()
-    target = entry.get_text().strip()
-    if soft_radio.get_active():
-        mode = 'soft'
-    elif hard_radio.get_active():
-        mode = 'hard'
-    else:
-        mode = 'mixed'
-    dialog.destroy()
+        if response == Gtk.ResponseType.OK and target:
+            on_done((target, mode))
 
-    if response == Gtk.ResponseType.OK and target:
-        return (target, mode)
-    return None
+    connect_pooled_response('reset_branch', dialog, on_response)
+    dialog.present()
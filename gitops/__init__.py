@@ -5,10 +5,13 @@ from .models import FileStatus, FileChange
 from .open_repository import open_repository
 from .get_repo_name import get_repo_name
 from .get_current_branch import get_current_branch
+from .get_head_sha import get_head_sha
 from .get_status import get_status
 from .get_diff import get_diff
 from .stage_file import stage_file
 from .unstage_file import unstage_file
+from .stage_files import stage_files
+from .unstage_files import unstage_files
 from .stage_all import stage_all
 from .unstage_all import unstage_all
 from .stage_hunk import stage_hunk
@@ -32,6 +35,7 @@ from .get_tags import get_tags
 from .create_branch import create_branch
 from .checkout_branch import checkout_branch
 from .delete_branch import delete_branch
+from .delete_branches import delete_branches
 from .rename_branch import rename_branch
 from .reset_branch import reset_branch
 from .merge_branch import merge_branch
@@ -57,12 +61,15 @@ __all__ = [
     'open_repository',
     'get_repo_name',
     'get_current_branch',
+    'get_head_sha',
     # Status and diff
     'get_status',
     'get_diff',
     # Staging
     'stage_file',
     'unstage_file',
+    'stage_files',
+    'unstage_files',
     'stage_all',
     'unstage_all',
     'stage_hunk',
@@ -95,6 +102,7 @@ __all__ = [
     'create_branch',
     'checkout_branch',
     'delete_branch',
+    'delete_branches',
     'rename_branch',
     'reset_branch',
     'merge_branch',
@@ -1,9 +1,31 @@
 """Shared utility functions for git operations (not exported)."""
 
+import threading
+import weakref
+
 from git.diff import Diff
 
 from .models import FileStatus
 
+# Repo -> lock serializing reads through its object database
+_ODB_LOCKS = weakref.WeakKeyDictionary()
+_ODB_LOCKS_GUARD = threading.Lock()
+
+
+def odb_lock(repo):
+    """Return the lock to hold while reading objects of a repository.
+
+    GitPython reads commits and trees through one persistent
+    git cat-file process per Repo, which is not safe to use from two
+    threads at once. Plain git commands (repo.git.*) run in their own
+    process and do not need the lock.
+    """
+    with _ODB_LOCKS_GUARD:
+        lock = _ODB_LOCKS.get(repo)
+        if lock is None:
+            lock = _ODB_LOCKS[repo] = threading.RLock()
+        return lock
+
 
 def diff_to_status(diff: Diff) -> FileStatus:
     """Convert git diff to FileStatus."""
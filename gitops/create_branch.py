@@ -4,6 +4,8 @@ from typing import Optional
 
 from git import Repo, GitCommandError
 
+from ._utils import odb_lock
+
 
 def create_branch(
     repo: Optional[Repo],
@@ -25,10 +27,12 @@ def create_branch(
     if not repo:
         return False, 'No repository open'
     try:
-        if start_point:
-            repo.create_head(name, start_point)
-        else:
-            repo.create_head(name)
+        # Resolving the start point reads the object database
+        with odb_lock(repo):
+            if start_point:
+                repo.create_head(name, start_point)
+            else:
+                repo.create_head(name)
         if checkout:
             repo.git.checkout(name)
             return True, f'Branch {name} created and checked out'
@@ -0,0 +1,30 @@
+"""Delete multiple branches operation."""
+
+from typing import Optional
+
+from git import Repo, GitCommandError
+
+
+def delete_branches(repo: Optional[Repo], names: list[str], force: bool = False) -> tuple[bool, str]:
+    """Delete several branches with a single git invocation.
+
+    Args:
+        repo: Git repository object
+        names: Branch names to delete
+        force: If True, force delete even if not merged
+
+    Returns:
+        Tuple of (success, message/error)
+    """
+    if not repo:
+        return False, 'No repository open'
+    if not names:
+        return False, 'No branches selected'
+    try:
+        flag = '-D' if force else '-d'
+        repo.git.branch(flag, *names)
+        if len(names) == 1:
+            return True, f'Branch {names[0]} deleted'
+        return True, f'{len(names)} branches deleted'
+    except GitCommandError as e:
+        return False, str(e)
@@ -21,8 +21,10 @@ def fetch(repo: Optional[Repo], remote_name: str,
         return False, 'No repository open'
 
     try:
-        remote = repo.remote(remote_name)
-        remote.fetch()
+        repo.remote(remote_name)
+        # Plain git fetch: Remote.fetch() parses its output through the
+        # object database, which would need the shared cat-file process
+        repo.git.fetch(remote_name)
         return True, f'Fetch from {remote_name} successful'
     except GitCommandError as e:
         return False, str(e)
@@ -4,6 +4,8 @@ from typing import Optional
 
 from git import Repo
 
+from ._utils import odb_lock
+
 
 def get_current_branch(repo: Optional[Repo]) -> str:
     """Get current branch name.
@@ -19,7 +21,10 @@ def get_current_branch(repo: Optional[Repo]) -> str:
     try:
         return repo.active_branch.name
     except TypeError:
-        # Detached HEAD state - try to find what we're detached at
+        pass
+
+    # Detached HEAD state - try to find what we're detached at
+    with odb_lock(repo):
         head_commit = repo.head.commit
         short_sha = head_commit.hexsha[:7]
 
@@ -35,5 +40,5 @@ def get_current_branch(repo: Optional[Repo]) -> str:
                 tracking_name = ref.path[len('refs/remotes/'):]
                 return f'HEAD detached at {tracking_name}'
 
-        # Fall back to showing the commit hash
-        return f'HEAD detached at {short_sha}'
+    # Fall back to showing the commit hash
+    return f'HEAD detached at {short_sha}'
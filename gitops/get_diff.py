@@ -5,6 +5,8 @@ from typing import Optional
 
 from git import Repo, GitCommandError
 
+from ._utils import odb_lock
+
 
 def get_diff(
     repo: Optional[Repo],
@@ -34,7 +36,10 @@ def get_diff(
     try:
         context_arg = f'-U{context_lines}'
         if staged:
-            if amend and repo.head.commit.parents:
+            if amend:
+                with odb_lock(repo):
+                    amend = bool(repo.head.commit.parents)
+            if amend:
                 # Amend: compare index to parent of HEAD
                 diff = repo.git.diff(context_arg, '--cached', 'HEAD~1', '--', path)
             else:
@@ -4,6 +4,8 @@ from typing import Optional
 
 from git import Repo
 
+from ._utils import odb_lock
+
 
 def get_file_log(repo: Optional[Repo], file_path: str, max_count: int = 50) -> list[dict]:
     """Get commit log for a specific file.
@@ -21,14 +23,15 @@ def get_file_log(repo: Optional[Repo], file_path: str, max_count: int = 50) -> l
 
     commits = []
     try:
-        for commit in repo.iter_commits(max_count=max_count, paths=file_path):
-            commits.append({
-                'hash': commit.hexsha,
-                'short_hash': commit.hexsha[:7],
-                'author': str(commit.author),
-                'date': commit.committed_datetime.isoformat(),
-                'message': commit.message.strip()
-            })
+        with odb_lock(repo):
+            for commit in repo.iter_commits(max_count=max_count, paths=file_path):
+                commits.append({
+                    'hash': commit.hexsha,
+                    'short_hash': commit.hexsha[:7],
+                    'author': str(commit.author),
+                    'date': commit.committed_datetime.isoformat(),
+                    'message': commit.message.strip()
+                })
     except Exception:
         pass
     return commits
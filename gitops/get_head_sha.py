@@ -0,0 +1,27 @@
+"""Get HEAD commit operation."""
+
+from typing import Optional
+
+from git import Repo
+
+from ._utils import odb_lock
+
+
+def get_head_sha(repo: Optional[Repo]) -> str:
+    """Get the full SHA of the commit HEAD points to.
+
+    Args:
+        repo: Git repository object
+
+    Returns:
+        Commit SHA, or empty string if there is no repository or HEAD
+        is unborn
+    """
+    if not repo:
+        return ''
+    try:
+        with odb_lock(repo):
+            return repo.head.commit.hexsha
+    except ValueError:
+        # Unborn branch (no commits yet)
+        return ''
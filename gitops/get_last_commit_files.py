@@ -5,7 +5,7 @@ from typing import Optional
 from git import Repo
 
 from .models import FileChange
-from ._utils import diff_to_status
+from ._utils import diff_to_status, odb_lock
 
 
 def get_last_commit_files(repo: Optional[Repo]) -> list[FileChange]:
@@ -20,16 +20,18 @@ def get_last_commit_files(repo: Optional[Repo]) -> list[FileChange]:
     if not repo:
         return []
     try:
-        commit = repo.head.commit
-        parent = commit.parents[0] if commit.parents else None
+        with odb_lock(repo):
+            commit = repo.head.commit
+            parent = commit.parents[0] if commit.parents else None
+
+            if parent:
+                # Compare with parent commit
+                diffs = parent.diff(commit)
+            else:
+                # Initial commit - all files are new
+                diffs = commit.diff(None, R=True)
 
         files = []
-        if parent:
-            # Compare with parent commit
-            diffs = parent.diff(commit)
-        else:
-            # Initial commit - all files are new
-            diffs = commit.diff(None, R=True)
 
         for diff in diffs:
             status = diff_to_status(diff)
@@ -4,6 +4,8 @@ from typing import Optional
 
 from git import Repo
 
+from ._utils import odb_lock
+
 
 def get_last_commit_message(repo: Optional[Repo]) -> str:
     """Get the last commit message.
@@ -17,6 +19,7 @@ def get_last_commit_message(repo: Optional[Repo]) -> str:
     if not repo:
         return ''
     try:
-        return repo.head.commit.message
+        with odb_lock(repo):
+            return repo.head.commit.message
     except Exception:
         return ''
@@ -5,7 +5,7 @@ from typing import Optional
 from git import Repo
 
 from .models import FileChange, FileStatus
-from ._utils import diff_to_status
+from ._utils import diff_to_status, odb_lock
 
 
 def get_status(repo: Optional[Repo]) -> tuple[list[FileChange], list[FileChange]]:
@@ -25,7 +25,8 @@ def get_status(repo: Optional[Repo]) -> tuple[list[FileChange], list[FileChange]
 
     # Get staged changes (index vs HEAD)
     try:
-        staged_diffs = repo.index.diff('HEAD')
+        with odb_lock(repo):
+            staged_diffs = repo.index.diff('HEAD')
         for diff in staged_diffs:
             status = diff_to_status(diff)
             old_path = diff.a_path if diff.renamed else None
@@ -42,19 +43,20 @@ def get_status(repo: Optional[Repo]) -> tuple[list[FileChange], list[FileChange]
 
     # Get new files staged
     try:
-        for entry in repo.index.entries:
-            path = entry[0]
-            # Check if file is new (not in HEAD)
-            try:
-                repo.head.commit.tree[path]
-            except (KeyError, ValueError):
-                # File is new
-                if not any(f.path == path for f in staged):
-                    staged.append(FileChange(
-                        path=path,
-                        status=FileStatus.ADDED,
-                        staged=True
-                    ))
+        with odb_lock(repo):
+            for entry in repo.index.entries:
+                path = entry[0]
+                # Check if file is new (not in HEAD)
+                try:
+                    repo.head.commit.tree[path]
+                except (KeyError, ValueError):
+                    # File is new
+                    if not any(f.path == path for f in staged):
+                        staged.append(FileChange(
+                            path=path,
+                            status=FileStatus.ADDED,
+                            staged=True
+                        ))
     except Exception:
         pass
 
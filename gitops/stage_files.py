@@ -0,0 +1,26 @@
+"""Stage files operation."""
+
+from typing import Optional
+
+from git import Repo, GitCommandError
+
+
+def stage_files(repo: Optional[Repo], paths: list[str]) -> bool:
+    """Stage several files with a single index update.
+
+    Deleted files are staged as deletions.
+
+    Args:
+        repo: Git repository object
+        paths: File paths to stage
+
+    Returns:
+        True if all files were staged, False otherwise
+    """
+    if not repo or not paths:
+        return False
+    try:
+        repo.git.add('-A', '--', *paths)
+        return True
+    except GitCommandError:
+        return False
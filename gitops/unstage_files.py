@@ -0,0 +1,30 @@
+"""Unstage files operation."""
+
+from typing import Optional
+
+from git import Repo, GitCommandError
+
+
+def unstage_files(repo: Optional[Repo], paths: list[str]) -> bool:
+    """Unstage several files with a single index update.
+
+    Args:
+        repo: Git repository object
+        paths: File paths to unstage
+
+    Returns:
+        True if all files were unstaged, False otherwise
+    """
+    if not repo or not paths:
+        return False
+    try:
+        # Reset files in index to HEAD state
+        repo.git.reset('HEAD', '--', *paths)
+        return True
+    except GitCommandError:
+        # No HEAD yet: every staged file is new, remove them from index
+        try:
+            repo.index.remove(paths, working_tree=False)
+            return True
+        except Exception:
+            return False
@@ -16,7 +16,8 @@ def find_git_root(path: str) -> Optional[str]:
     """
     current = os.path.abspath(path)
     while current != '/':
-        if os.path.isdir(os.path.join(current, '.git')):
+        # .git may be a file (worktrees, submodules)
+        if os.path.exists(os.path.join(current, '.git')):
             return current
         current = os.path.dirname(current)
     return None
@@ -171,3 +172,33 @@ def is_binary_file(filepath: str) -> bool:
             return non_text / len(chunk) > 0.3 if chunk else False
     except Exception:
         return False
+
+
+def is_valid_remote_name(name: str) -> bool:
+    """Check if a remote name is valid.
+
+    Remote names become part of refs (refs/remotes/<name>/...), so they
+    follow the same rules as branch names.
+
+    Args:
+        name: Remote name to validate
+
+    Returns:
+        True if valid, False otherwise
+    """
+    return is_valid_branch_name(name)
+
+
+def is_valid_remote_url(url: str) -> bool:
+    """Check if a remote URL is plausible.
+
+    Git accepts URLs, scp-like addresses and local paths, so this only
+    rejects values that can never work: empty strings and whitespace.
+
+    Args:
+        url: Remote URL to validate
+
+    Returns:
+        True if plausible, False otherwise
+    """
+    return bool(url) and not re.search(r'\s', url)
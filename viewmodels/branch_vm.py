@@ -4,11 +4,24 @@ import gitops
 
 
 class BranchViewModel:
-    """ViewModel for branch operations."""
+    """ViewModel for branch operations.
+
+    The View runs these operations in the background and reports the
+    returned (success, message) itself, so they post no status messages.
+    """
 
     def __init__(self, repo_vm):
         self._repo_vm = repo_vm
 
+    def _refresh_branches(self):
+        """Drop the branch caches and have the View rescan.
+
+        Operations run on a worker thread; the forced rescan re-reads the
+        current branch and applies it on the main thread.
+        """
+        self._repo_vm.invalidate_branches(reread=False)
+        self._repo_vm.schedule_rescan(force=True)
+
     def create_branch(self, name, base=None, checkout=False):
         """Create a new branch.
 
@@ -18,9 +31,8 @@ class BranchViewModel:
         success, message = gitops.create_branch(
             self._repo_vm.repo, name, start_point=base, checkout=checkout
         )
-        self._repo_vm._status(message)
         if success:
-            self._repo_vm._update_branch_name()
+            self._refresh_branches()
         return success, message
 
     def checkout_branch(self, name):
@@ -30,10 +42,8 @@ class BranchViewModel:
             (success, message) tuple
         """
         success, message = gitops.checkout_branch(self._repo_vm.repo, name)
-        self._repo_vm._status(message)
         if success:
-            self._repo_vm._update_branch_name()
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan(force=True)
         return success, message
 
     def rename_branch(self, old_name, new_name):
@@ -43,19 +53,19 @@ class BranchViewModel:
             (success, message) tuple
         """
         success, message = gitops.rename_branch(self._repo_vm.repo, old_name, new_name)
-        self._repo_vm._status(message)
         if success:
-            self._repo_vm._update_branch_name()
+            self._refresh_branches()
         return success, message
 
-    def delete_branch(self, name, force=False):
-        """Delete a branch.
+    def delete_branches(self, names, force=False):
+        """Delete one or more branches with a single git call.
 
         Returns:
             (success, message) tuple
         """
-        success, message = gitops.delete_branch(self._repo_vm.repo, name, force=force)
-        self._repo_vm._status(message)
+        success, message = gitops.delete_branches(self._repo_vm.repo, names, force=force)
+        # git branch -d deletes what it can even when one name fails
+        self._refresh_branches()
         return success, message
 
     def reset_branch(self, target, mode='mixed'):
@@ -65,9 +75,8 @@ class BranchViewModel:
             (success, message) tuple
         """
         success, message = gitops.reset_branch(self._repo_vm.repo, target, mode=mode)
-        self._repo_vm._status(message)
         if success:
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan(force=True)
         return success, message
 
     def merge_branch(self, branch, strategy='default'):
@@ -79,10 +88,8 @@ class BranchViewModel:
         success, message = gitops.merge_branch(
             self._repo_vm.repo, branch, strategy=strategy
         )
-        self._repo_vm._status(message)
         if success:
-            self._repo_vm._update_branch_name()
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan(force=True)
         return success, message
 
     def rebase_branch(self, onto):
@@ -92,8 +99,6 @@ class BranchViewModel:
             (success, message) tuple
         """
         success, message = gitops.rebase_branch(self._repo_vm.repo, onto)
-        self._repo_vm._status(message)
         if success:
-            self._repo_vm._update_branch_name()
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan(force=True)
         return success, message
@@ -14,6 +14,9 @@ class CommitViewModel:
         self._repo_vm = repo_vm
         self.amend_mode = False
 
+        # (repo, HEAD sha, message, files) of the last commit read for amend
+        self._last_commit_cache = None
+
     def commit(self, message, amend=False, sign_off=False):
         """Perform a commit.
 
@@ -29,7 +32,8 @@ class CommitViewModel:
         if success:
             self._repo_vm._status(result_msg)
             self.amend_mode = False
-            self._repo_vm.rescan()
+            # A detached HEAD label includes the commit it points at
+            self._repo_vm.schedule_rescan(force=True)
         return success, result_msg
 
     def get_amend_data(self):
@@ -38,12 +42,36 @@ class CommitViewModel:
         Returns:
             (last_commit_message, merged_staged_files) tuple
         """
-        last_msg = gitops.get_last_commit_message(self._repo_vm.repo)
-        _, currently_staged = gitops.get_status(self._repo_vm.repo)
-        merged_files = self.get_amend_staged_files(currently_staged)
+        last_msg, merged_files = self.load_amend_data()
         self.amend_mode = True
         return last_msg, merged_files
 
+    def load_amend_data(self):
+        """Read the data needed to enter amend mode without changing state.
+
+        Safe to call from a worker thread; set amend_mode on the main
+        thread once the result is applied.
+
+        Returns:
+            (last_commit_message, merged_staged_files) tuple
+        """
+        last_msg, _ = self._get_last_commit()
+        _, currently_staged = self._repo_vm.get_status()
+        return last_msg, self.get_amend_staged_files(currently_staged)
+
+    def _get_last_commit(self):
+        """Return (message, files) of the HEAD commit, cached by its SHA."""
+        repo = self._repo_vm.repo
+        head = gitops.get_head_sha(repo)
+        cache = self._last_commit_cache
+        if head and cache is not None and cache[0] is repo and cache[1] == head:
+            return cache[2], cache[3]
+
+        message = gitops.get_last_commit_message(repo)
+        files = gitops.get_last_commit_files(repo)
+        self._last_commit_cache = (repo, head, message, files)
+        return message, files
+
     def get_amend_staged_files(self, currently_staged):
         """Merge last commit files with currently staged files for amend display.
 
@@ -53,17 +81,18 @@ class CommitViewModel:
         Returns:
             Merged list of FileChange objects
         """
-        last_commit_files = gitops.get_last_commit_files(self._repo_vm.repo)
-        staged_paths = {f.path for f in last_commit_files}
+        # Keyed by path: last commit entries first and taking precedence
+        _, last_commit_files = self._get_last_commit()
+        merged = {f.path: f for f in last_commit_files}
         for f in currently_staged:
-            if f.path not in staged_paths:
-                last_commit_files.append(f)
-        return last_commit_files
+            merged.setdefault(f.path, f)
+        return list(merged.values())
 
     def leave_amend_mode(self):
         """Leave amend mode and rescan."""
         self.amend_mode = False
-        self._repo_vm.rescan()
+        # Nothing on disk changed; force so the lists are redrawn
+        self._repo_vm.schedule_rescan(force=True)
 
     def toggle_amend(self):
         """Toggle amend mode.
@@ -1,5 +1,9 @@
 """DiffViewModel - manages diff display, hunk/line staging, and revert operations."""
 
+import os
+import threading
+from collections import OrderedDict
+
 import gitops
 from gitops import FileStatus
 
@@ -14,6 +18,9 @@ _STATUS_MAP = {
     FileStatus.UNMERGED: 'Unmerged',
 }
 
+# Number of recently computed diffs kept in memory
+_DIFF_CACHE_SIZE = 32
+
 
 class DiffViewModel:
     """ViewModel for diff display and hunk/line operations.
@@ -43,6 +50,9 @@ class DiffViewModel:
         self.current_file = None
         self._current_diff_staged = False
         self.amend_mode = False
+        self._diff_cache = OrderedDict()
+        self._cache_head = None
+        self._cache_lock = threading.Lock()
 
     def show_diff(self, file_change, staged, context_lines=None):
         """Compute diff for a file and store the results.
@@ -52,12 +62,19 @@ class DiffViewModel:
         """
         if context_lines is not None:
             self.context_lines = context_lines
+        self.set_diff(file_change, staged, self.load_diff(file_change, staged))
 
-        self.diff_text = gitops.get_diff(
-            self._repo_vm.repo, self._repo_vm.repo_path, file_change.path,
-            staged=staged, context_lines=self.context_lines,
-            amend=self.amend_mode and staged
-        )
+    def load_diff(self, file_change, staged):
+        """Compute the diff text for a file without changing any state.
+
+        Safe to call from a worker thread; pass the result to set_diff()
+        on the main thread.
+        """
+        return self._get_diff(file_change.path, staged)
+
+    def set_diff(self, file_change, staged, diff_text):
+        """Store a diff computed by load_diff() as the current diff."""
+        self.diff_text = diff_text
         self.file_path = file_change.path
         self.status_text = self._get_file_status_text(file_change, staged)
         self.is_staged = staged
@@ -65,6 +82,65 @@ class DiffViewModel:
         self.current_file = file_change
         self._current_diff_staged = staged
 
+    def _get_diff(self, path, staged):
+        """Return the diff for a file, reusing a cached result when possible."""
+        amend = self.amend_mode and staged
+        key = (path, staged, self.context_lines, amend, self._stat_key(path, staged))
+        with self._cache_lock:
+            diff = self._diff_cache.get(key)
+            if diff is not None:
+                self._diff_cache.move_to_end(key)
+                return diff
+
+        diff = gitops.get_diff(
+            self._repo_vm.repo, self._repo_vm.repo_path, path,
+            staged=staged, context_lines=self.context_lines, amend=amend
+        )
+        with self._cache_lock:
+            self._diff_cache[key] = diff
+            if len(self._diff_cache) > _DIFF_CACHE_SIZE:
+                self._diff_cache.popitem(last=False)
+        return diff
+
+    def _stat_key(self, path, staged):
+        """Return modification times that a cached diff depends on.
+
+        Staged diffs depend on the index only; unstaged diffs also depend
+        on the working tree file.
+        """
+        repo = self._repo_vm.repo
+        key = []
+        paths = [os.path.join(repo.git_dir, 'index')] if repo else []
+        if not staged:
+            paths.append(os.path.join(self._repo_vm.repo_path, path))
+        for p in paths:
+            try:
+                st = os.stat(p)
+                key.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                key.append(None)
+        return tuple(key)
+
+    def invalidate_cache(self, paths=None, head_sha=''):
+        """Drop cached diffs that may be out of date (call after a rescan).
+
+        Cached diffs are keyed by index and file modification times, so
+        they only go stale when HEAD moves; then everything is dropped.
+        Otherwise only entries for files outside paths (the files still
+        listed) are dropped. With paths None the whole cache is cleared.
+
+        Args:
+            paths: Set of paths in the unstaged and staged lists
+            head_sha: HEAD commit SHA read by the scan
+        """
+        with self._cache_lock:
+            if paths is None or head_sha != self._cache_head:
+                self._diff_cache.clear()
+                self._cache_head = head_sha
+                return
+            for key in [k for k in self._diff_cache if k[0] not in paths]:
+                del self._diff_cache[key]
+
     def clear(self):
         """Clear the current diff state."""
         self.diff_text = ''
@@ -85,22 +161,24 @@ class DiffViewModel:
             return True
         return False
 
-    def is_stale(self, unstaged_files, staged_files):
+    def is_stale(self, paths):
         """Check if the currently displayed file is no longer in the file lists.
 
+        Args:
+            paths: Set of paths in the unstaged and staged lists
+
         Returns True if the diff is stale and should be cleared.
         """
         if not self.current_file:
             return False
-        all_paths = [f.path for f in unstaged_files + staged_files]
-        return self.current_file.path not in all_paths
+        return self.current_file.path not in paths
 
     def stage_hunk(self, file_path, line):
         """Stage a hunk at the given diff line."""
         success, message = gitops.stage_hunk(self._repo_vm.repo, file_path, line)
         self._repo_vm._status(message)
         if success:
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan()
 
     def stage_lines(self, file_path, start_line, end_line):
         """Stage lines in the given diff line range."""
@@ -109,14 +187,14 @@ class DiffViewModel:
         )
         self._repo_vm._status(message)
         if success:
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan()
 
     def unstage_hunk(self, file_path, line):
         """Unstage a hunk at the given diff line."""
         success, message = gitops.unstage_hunk(self._repo_vm.repo, file_path, line)
         self._repo_vm._status(message)
         if success:
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan()
 
     def unstage_lines(self, file_path, start_line, end_line):
         """Unstage lines in the given diff line range."""
@@ -125,14 +203,14 @@ class DiffViewModel:
         )
         self._repo_vm._status(message)
         if success:
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan()
 
     def revert_hunk(self, file_path, line):
         """Revert a hunk. View must confirm before calling."""
         success, message = gitops.revert_hunk(self._repo_vm.repo, file_path, line)
         self._repo_vm._status(message)
         if success:
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan(force=True)
 
     def revert_lines(self, file_path, start_line, end_line):
         """Revert lines. View must confirm before calling."""
@@ -141,7 +219,7 @@ class DiffViewModel:
         )
         self._repo_vm._status(message)
         if success:
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan(force=True)
 
     @staticmethod
     def _get_file_status_text(file_change, staged):
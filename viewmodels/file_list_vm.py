@@ -17,7 +17,7 @@ class FileListViewModel:
         """Stage a single file."""
         if gitops.stage_file(self._repo_vm.repo, file_change.path, file_change.status):
             self._repo_vm._status('Staged: ' + file_change.path)
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan()
         else:
             self._repo_vm._status('Failed to stage: ' + file_change.path, 'error')
 
@@ -25,15 +25,54 @@ class FileListViewModel:
         """Unstage a single file."""
         if gitops.unstage_file(self._repo_vm.repo, file_change.path):
             self._repo_vm._status('Unstaged: ' + file_change.path)
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan()
         else:
             self._repo_vm._status('Failed to unstage: ' + file_change.path, 'error')
 
+    def stage_files(self, file_changes):
+        """Stage several files in one index update, rescanning once at the end.
+
+        If the batch fails, the files are staged one at a time to find
+        the ones that failed.
+        """
+        repo = self._repo_vm.repo
+        failed = []
+        if not gitops.stage_files(repo, [fc.path for fc in file_changes]):
+            failed = [fc.path for fc in file_changes
+                      if not gitops.stage_file(repo, fc.path, fc.status)]
+        self._finish_batch(file_changes, failed, 'Staged', 'stage')
+
+    def unstage_files(self, file_changes):
+        """Unstage several files in one index update, rescanning once at the end.
+
+        If the batch fails, the files are unstaged one at a time to find
+        the ones that failed.
+        """
+        repo = self._repo_vm.repo
+        failed = []
+        if not gitops.unstage_files(repo, [fc.path for fc in file_changes]):
+            failed = [fc.path for fc in file_changes
+                      if not gitops.unstage_file(repo, fc.path)]
+        self._finish_batch(file_changes, failed, 'Unstaged', 'unstage')
+
+    def _finish_batch(self, file_changes, failed, done_label, verb):
+        """Report the outcome of a batch operation and rescan if anything changed."""
+        if failed:
+            self._repo_vm._status(
+                'Failed to {}: {}'.format(verb, ', '.join(failed)), 'error'
+            )
+        elif len(file_changes) == 1:
+            self._repo_vm._status('{}: {}'.format(done_label, file_changes[0].path))
+        else:
+            self._repo_vm._status('{} {} files'.format(done_label, len(file_changes)))
+        if len(failed) < len(file_changes):
+            self._repo_vm.schedule_rescan()
+
     def stage_all(self):
         """Stage all unstaged files."""
         if gitops.stage_all(self._repo_vm.repo):
             self._repo_vm._status('Staged all changes')
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan()
         else:
             self._repo_vm._status('Failed to stage all changes', 'error')
 
@@ -41,7 +80,7 @@ class FileListViewModel:
         """Unstage all staged files."""
         if gitops.unstage_all(self._repo_vm.repo):
             self._repo_vm._status('Unstaged all changes')
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan()
         else:
             self._repo_vm._status('Failed to unstage all changes', 'error')
 
@@ -53,4 +92,24 @@ class FileListViewModel:
         """
         success, message = gitops.revert_file(self._repo_vm.repo, path)
         self._repo_vm._status(message)
-        self._repo_vm.rescan()
+        self._repo_vm.schedule_rescan(force=True)
+
+    def revert_files(self, paths):
+        """Revert several file paths, rescanning once at the end.
+
+        The View is responsible for showing a confirmation dialog
+        before calling this method.
+        """
+        if len(paths) == 1:
+            self.revert_file(paths[0])
+            return
+        errors = []
+        for path in paths:
+            success, message = gitops.revert_file(self._repo_vm.repo, path)
+            if not success:
+                errors.append(message)
+        if errors:
+            self._repo_vm._status(errors[0], 'error')
+        else:
+            self._repo_vm._status('Reverted {} files'.format(len(paths)))
+        self._repo_vm.schedule_rescan(force=True)
@@ -5,6 +5,8 @@ The View is responsible for running them in background threads and
 dispatching results back to the main thread.
 """
 
+import os
+
 import gitops
 
 
@@ -14,6 +16,45 @@ class RemoteViewModel:
     def __init__(self, repo_vm):
         self._repo_vm = repo_vm
 
+        # Values read from the repository config, and the (repo, config
+        # file stat, current branch) they were read under
+        self._config_key = None
+        self._remote_names = None
+        self._tracking_remote = None
+
+    def get_remote_names(self):
+        """Return remote names, re-read only when the repository config changes."""
+        self._refresh_config()
+        return self._remote_names
+
+    def get_tracking_remote(self):
+        """Return the remote tracked by the current branch, or '' if none."""
+        self._refresh_config()
+        return self._tracking_remote
+
+    def _refresh_config(self):
+        """Re-read config-derived values if the config file or branch changed."""
+        repo = self._repo_vm.repo
+        key = (repo, self._get_config_stat(repo), self._repo_vm.branch_name)
+        if key != self._config_key:
+            self._remote_names = gitops.get_remotes(repo)
+            self._tracking_remote = gitops.get_tracking_remote(repo) or ''
+            self._config_key = key
+
+    @staticmethod
+    def _get_config_stat(repo):
+        """Return stat data of the repository config file (None if missing)."""
+        if repo is None:
+            return None
+        try:
+            st = os.stat(os.path.join(repo.common_dir, 'config'))
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _invalidate_remote_names(self):
+        self._config_key = None
+
     def push(self, remote_name, branch_name=None, force=False, tags=False):
         """Push to a remote (synchronous).
 
@@ -32,7 +73,7 @@ class RemoteViewModel:
             self._repo_vm.repo, remote_name, branch_name, ff_only, rebase
         )
         if success:
-            self._repo_vm.rescan()
+            self._repo_vm.schedule_rescan(force=True)
         return success, message
 
     def fetch(self, remote_name):
@@ -41,15 +82,27 @@ class RemoteViewModel:
         Returns:
             (success, message) tuple
         """
-        return gitops.fetch(self._repo_vm.repo, remote_name)
+        success, message = gitops.fetch(self._repo_vm.repo, remote_name)
+        if success:
+            # A detached HEAD is labelled by the remote ref it matches;
+            # the forced rescan re-reads it along with the file lists
+            self._repo_vm.invalidate_branches(reread=False)
+            self._repo_vm.schedule_rescan(force=True)
+        return success, message
 
-    def add_remote(self, name, url):
-        """Add a new remote.
+    def add_remote(self, name, url, fetch=False):
+        """Add a new remote, optionally fetching from it in the same call.
 
         Returns:
-            (success, message) tuple
+            (success, message) tuple; with fetch, the result of the fetch
+            once the remote was added
         """
-        return gitops.add_remote(self._repo_vm.repo, name, url)
+        success, message = gitops.add_remote(self._repo_vm.repo, name, url)
+        if success:
+            self._invalidate_remote_names()
+            if fetch:
+                return self.fetch(name)
+        return success, message
 
     def rename_remote(self, old_name, new_name):
         """Rename a remote.
@@ -57,12 +110,29 @@ class RemoteViewModel:
         Returns:
             (success, message) tuple
         """
-        return gitops.rename_remote(self._repo_vm.repo, old_name, new_name)
+        success, message = gitops.rename_remote(self._repo_vm.repo, old_name, new_name)
+        if success:
+            self._invalidate_remote_names()
+        return success, message
 
-    def delete_remote(self, name):
-        """Delete a remote.
+    def delete_remotes(self, names):
+        """Delete one or more remotes.
+
+        Stops at the first failure; the remote name cache is invalidated
+        once for the whole batch.
 
         Returns:
             (success, message) tuple
         """
-        return gitops.delete_remote(self._repo_vm.repo, name)
+        deleted = 0
+        success, message = False, 'No remotes selected'
+        for name in names:
+            success, message = gitops.delete_remote(self._repo_vm.repo, name)
+            if not success:
+                break
+            deleted += 1
+        if deleted:
+            self._invalidate_remote_names()
+        if success and deleted > 1:
+            message = f'{deleted} remotes deleted'
+        return success, message
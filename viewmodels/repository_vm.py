@@ -1,5 +1,7 @@
 """RepositoryViewModel - manages repository lifecycle, scanning, and status."""
 
+import os
+
 import gitops
 
 
@@ -14,10 +16,12 @@ class RepositoryViewModel:
         unstaged_files: list of FileChange
         staged_files: list of FileChange
         has_staged_files: bool
+        head_sha: HEAD commit SHA at the last status scan (str)
 
     Callbacks (set by the View):
         on_state_changed: called after any state mutation (rescan, open, close)
         set_status: called with (message, msg_type) to display status
+        request_rescan: called with (force) to run a coalesced rescan later
     """
 
     def __init__(self):
@@ -28,10 +32,21 @@ class RepositoryViewModel:
         self.unstaged_files = []
         self.staged_files = []
         self.has_staged_files = False
+        self.head_sha = ''
+
+        # Local branch names, cached until invalidate_branches()
+        self._branches = None
+
+        # Stat data of .git/index and .git/HEAD at the last status scan
+        self._scan_signature = None
+
+        # (repo, HEAD file contents, branch name) of the last branch lookup
+        self._branch_memo = None
 
         # Callbacks — set by the View
         self.on_state_changed = None
         self.set_status = None
+        self.request_rescan = None
 
     def _notify_changed(self):
         if self.on_state_changed:
@@ -41,54 +56,237 @@ class RepositoryViewModel:
         if self.set_status:
             self.set_status(message, msg_type)
 
-    def open_repository(self, path):
+    def open_repository(self, path, scan=True):
         """Open a git repository.
 
+        The View may instead run load_repository() on a worker thread and
+        pass its result to set_repository() on the main thread.
+
+        Args:
+            path: Path inside the repository
+            scan: Rescan immediately; pass False if the View starts the
+                first scan itself
+
         Returns:
             True if the repository was opened successfully.
         """
-        repo, repo_path = gitops.open_repository(path)
-        if repo:
-            self.repo = repo
-            self.repo_path = repo_path
-            self.repo_name = gitops.get_repo_name(repo_path)
-            self._update_branch_name()
+        if not self.set_repository(path, self.load_repository(path)):
+            return False
+        if scan:
             self.rescan()
-            self._status('Opened repository: ' + path)
-            return True
-        else:
+        return True
+
+    def load_repository(self, path):
+        """Open a repository without changing any state.
+
+        Safe to call from a worker thread.
+
+        Returns:
+            Opaque result for set_repository(), or None if path is not
+            inside a git repository
+        """
+        repo, repo_path = gitops.open_repository(path)
+        if not repo:
+            return None
+        return repo, repo_path, self._get_current_branch(repo)
+
+    def set_repository(self, path, loaded):
+        """Make a repository returned by load_repository() the current one.
+
+        Returns:
+            True if the repository was opened successfully.
+        """
+        if loaded is None:
             self._status('Not a git repository: ' + path, 'warning')
             return False
 
-    def rescan(self):
-        """Rescan the repository for changes."""
+        self.repo, self.repo_path, self.branch_name = loaded
+        self.repo_name = gitops.get_repo_name(self.repo_path)
+        self.head_sha = ''
+        self._scan_signature = None
+        self._branches = None
+        self._status('Opened repository: ' + path)
+        return True
+
+    def rescan(self, force=False):
+        """Rescan the repository for changes.
+
+        Without force, the scan is skipped when neither the index nor HEAD
+        has been written since the last one. Edits to work tree files
+        alone do not touch either, so callers that only change the work
+        tree (reverts, user-initiated rescans) must pass force=True.
+
+        The View may instead run collect_status() on a worker thread and
+        pass its result to apply_status() on the main thread.
+
+        Args:
+            force: Always run git status, and drop the cached branch
+                list, which is otherwise kept until a branch-changing
+                operation invalidates it
+        """
+        self.apply_status(self.collect_status(force))
+
+    def collect_status(self, force=False):
+        """Run the git queries for a rescan without changing any state.
+
+        Safe to call from a worker thread.
+
+        Returns:
+            Opaque result for apply_status(), or None if nothing changed
+            since the last scan (or no repository is open)
+        """
+        repo = self.repo
+        if repo is None:
+            return None
+
+        signature = self._get_scan_signature(repo)
+        if not force and signature == self._scan_signature:
+            return None
+
+        unstaged, staged = gitops.get_status(repo)
+        head_sha = gitops.get_head_sha(repo)
+        # Memoized on .git/HEAD, so this only queries git when HEAD moved
+        branch_name = self._get_current_branch(repo)
+        return repo, signature, unstaged, staged, head_sha, branch_name, force
+
+    def apply_status(self, result):
+        """Store a collect_status() result and notify the View."""
         if self.repo is None:
             return
+        if result is None:
+            self._status('{} unstaged, {} staged changes'.format(
+                len(self.unstaged_files), len(self.staged_files)))
+            return
+
+        repo, signature, unstaged, staged, head_sha, branch_name, force = result
+        if repo is not self.repo:
+            # Another repository was opened while the scan ran
+            return
 
-        unstaged, staged = gitops.get_status(self.repo)
         self.unstaged_files = unstaged
         self.staged_files = staged
         self.has_staged_files = len(staged) > 0
+        self.head_sha = head_sha
+        self._scan_signature = signature
 
-        self._update_branch_name()
+        if force or branch_name != self.branch_name:
+            self._branches = None
+        self.branch_name = branch_name
         self._status('{} unstaged, {} staged changes'.format(
             len(unstaged), len(staged)))
         self._notify_changed()
 
+    def show_cached_status(self, unstaged, staged):
+        """Show file lists saved in an earlier session until a scan completes.
+
+        The scan signature is left unset, so the next scan always replaces
+        them.
+        """
+        self.unstaged_files = unstaged
+        self.staged_files = staged
+        self.has_staged_files = len(staged) > 0
+        self._notify_changed()
+
+    def get_status(self):
+        """Return (unstaged, staged) file lists without notifying the View.
+
+        The lists from the last scan are reused when neither the index nor
+        HEAD has been written since. Staged changes depend only on those
+        two; unstaged ones may miss work tree edits made since the scan.
+        """
+        repo = self.repo
+        if repo is None:
+            return [], []
+        if (self._scan_signature is not None
+                and self._get_scan_signature(repo) == self._scan_signature):
+            return list(self.unstaged_files), list(self.staged_files)
+        return gitops.get_status(repo)
+
+    def schedule_rescan(self, force=False):
+        """Ask the View for a rescan; rescans immediately if it has no scheduler.
+
+        Several requests in quick succession result in a single rescan.
+        """
+        if self.request_rescan:
+            self.request_rescan(force)
+        else:
+            self.rescan(force=force)
+
+    @staticmethod
+    def _get_scan_signature(repo):
+        """Return stat data of .git/index and .git/HEAD (None if missing).
+
+        Git rewrites both files through a lock file and rename, so the
+        inode changes on every write even where mtimes are coarse.
+        """
+        signature = []
+        for name in ('index', 'HEAD'):
+            try:
+                st = os.stat(os.path.join(repo.git_dir, name))
+                signature.append((st.st_mtime_ns, st.st_size, st.st_ino))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
     def close_repository(self):
         """Close the current repository."""
         self.repo = None
         self.repo_path = ''
         self.repo_name = ''
         self.branch_name = ''
+        self.head_sha = ''
+        self._branches = None
+        self._scan_signature = None
+        self._branch_memo = None
         self.unstaged_files = []
         self.staged_files = []
         self.has_staged_files = False
         self._notify_changed()
 
+    def get_branches(self):
+        """Return local branch names, cached until invalidate_branches()."""
+        if self._branches is None:
+            self._branches = gitops.get_branches(self.repo)
+        return self._branches
+
+    def invalidate_branches(self, reread=True):
+        """Re-read the current branch and drop the cached branch list.
+
+        Call after operations that create, delete, rename or switch branches.
+
+        Args:
+            reread: Read the current branch now; when False it is read by
+                the next forced scan instead
+        """
+        self._branches = None
+        self._branch_memo = None
+        if reread:
+            self._update_branch_name()
+
     def _update_branch_name(self):
         """Update the branch name from the current repo."""
         if self.repo:
-            self.branch_name = gitops.get_current_branch(self.repo) or ''
+            self.branch_name = self._get_current_branch(self.repo)
         else:
             self.branch_name = ''
+
+    def _get_current_branch(self, repo):
+        """Return the current branch name, reusing the last one if HEAD is unchanged.
+
+        Naming a detached HEAD walks tags and remote refs, so the result
+        is kept until .git/HEAD changes or invalidate_branches() is called.
+        Safe to call from a worker thread.
+        """
+        try:
+            with open(os.path.join(repo.git_dir, 'HEAD'), 'rb') as f:
+                head = f.read()
+        except OSError:
+            head = None
+
+        memo = self._branch_memo
+        if head is not None and memo is not None and memo[0] is repo and memo[1] == head:
+            return memo[2]
+
+        name = gitops.get_current_branch(repo) or ''
+        self._branch_memo = (repo, head, name)
+        return name
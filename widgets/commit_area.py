@@ -172,6 +172,10 @@ class CommitArea(Gtk.Box):
         """Set amend mode."""
         self._amend_check.set_active(enabled)
 
+    def set_amend_sensitive(self, sensitive):
+        """Enable or disable the amend checkbox."""
+        self._amend_check.set_sensitive(sensitive)
+
     def is_signoff_enabled(self):
         """Check if sign-off is enabled."""
         return self._signoff_check.get_active()
@@ -141,6 +141,14 @@ class DiffView(Gtk.Box):
             0.0, False, 0.0, 0.0
         )
 
+    def set_loading(self, file_path):
+        """Show a loading indicator while a new diff is being computed.
+
+        The previous diff stays visible until set_diff() replaces it.
+        """
+        self._file_label.set_text(file_path)
+        self._status_label.set_text('Loading...')
+
     def clear(self):
         """Clear the diff view."""
         self._buffer.set_text('')
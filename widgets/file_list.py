@@ -24,6 +24,17 @@ CSS = b'''
 }
 '''
 
+# One-letter status labels shown in the first column
+_STATUS_LABELS = {
+    FileStatus.MODIFIED: 'M',
+    FileStatus.ADDED: 'A',
+    FileStatus.DELETED: 'D',
+    FileStatus.RENAMED: 'R',
+    FileStatus.COPIED: 'C',
+    FileStatus.UNTRACKED: '?',
+    FileStatus.UNMERGED: 'U',
+}
+
 
 class FileListWidget(Gtk.Box):
     """Widget displaying a list of files with their status."""
@@ -33,7 +44,8 @@ class FileListWidget(Gtk.Box):
     __gsignals__ = {
         'file-selected': (GObject.SignalFlags.RUN_FIRST, None, (object,)),
         'file-activated': (GObject.SignalFlags.RUN_FIRST, None, (object,)),
-        'file-revert-requested': (GObject.SignalFlags.RUN_FIRST, None, (object,)),
+        'files-activated': (GObject.SignalFlags.RUN_FIRST, None, (object,)),
+        'files-revert-requested': (GObject.SignalFlags.RUN_FIRST, None, (object,)),
         'file-history-requested': (GObject.SignalFlags.RUN_FIRST, None, (object,)),
     }
 
@@ -91,8 +103,8 @@ class FileListWidget(Gtk.Box):
         scrolled.set_hexpand(True)
         scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
 
-        # Create list store: status_label, path, index
-        self._store = Gtk.ListStore(str, str, int)
+        # Create list store: status_label, path, FileChange
+        self._store = Gtk.ListStore(str, str, object)
 
         # Create tree view
         self._tree_view = Gtk.TreeView(model=self._store)
@@ -117,6 +129,7 @@ class FileListWidget(Gtk.Box):
 
         # Selection handling
         selection = self._tree_view.get_selection()
+        selection.set_mode(Gtk.SelectionMode.MULTIPLE)
         selection.connect('changed', self._on_selection_changed)
 
         # Double-click handling
@@ -133,11 +146,10 @@ class FileListWidget(Gtk.Box):
 
     def _status_cell_data_func(self, column, cell, model, iter, data=None):
         """Set cell color based on status."""
-        status_label = model.get_value(iter, 0)
-        idx = model.get_value(iter, 2)
+        file_change = model.get_value(iter, 2)
 
-        if idx < len(self._files):
-            status = self._files[idx].status
+        if file_change is not None:
+            status = file_change.status
             if status == FileStatus.ADDED or status == FileStatus.UNTRACKED:
                 cell.set_property('foreground', '#26a269')  # Green
             elif status == FileStatus.DELETED:
@@ -152,20 +164,19 @@ class FileListWidget(Gtk.Box):
             cell.set_property('foreground', None)
 
     def _on_selection_changed(self, selection):
-        """Handle selection change."""
-        model, iter = selection.get_selected()
-        if iter:
-            idx = model.get_value(iter, 2)
-            if idx < len(self._files):
-                self.emit('file-selected', self._files[idx])
+        """Handle selection change.
+
+        'file-selected' is only emitted when exactly one row is selected.
+        """
+        files = self.get_selected_files()
+        if len(files) == 1:
+            self.emit('file-selected', files[0])
 
     def _on_row_activated(self, tree_view, path, column):
         """Handle row double-click activation."""
-        model = tree_view.get_model()
-        iter = model.get_iter(path)
-        idx = model.get_value(iter, 2)
-        if idx < len(self._files):
-            self.emit('file-activated', self._files[idx])
+        file_change = tree_view.get_model()[path][2]
+        if file_change is not None:
+            self.emit('file-activated', file_change)
 
     def _create_context_menu(self):
         """Create context menu for file list."""
@@ -208,28 +219,32 @@ class FileListWidget(Gtk.Box):
             path_info = tree_view.get_path_at_pos(int(event.x), int(event.y))
             if path_info:
                 path, column, x, y = path_info
-                tree_view.get_selection().select_path(path)
+                # Keep a multi-row selection when clicking inside it
+                selection = tree_view.get_selection()
+                if not selection.path_is_selected(path):
+                    selection.unselect_all()
+                    selection.select_path(path)
                 self._context_menu.popup_at_pointer(event)
                 return True
         return False
 
     def _on_context_stage(self, menu_item):
         """Handle Stage to Commit context menu action."""
-        file_change = self.get_selected_file()
-        if file_change:
-            self.emit('file-activated', file_change)
+        files = self.get_selected_files()
+        if files:
+            self.emit('files-activated', files)
 
     def _on_context_unstage(self, menu_item):
         """Handle Unstage from Commit context menu action."""
-        file_change = self.get_selected_file()
-        if file_change:
-            self.emit('file-activated', file_change)
+        files = self.get_selected_files()
+        if files:
+            self.emit('files-activated', files)
 
     def _on_context_revert(self, menu_item):
         """Handle Revert Changes context menu action."""
-        file_change = self.get_selected_file()
-        if file_change:
-            self.emit('file-revert-requested', file_change)
+        files = self.get_selected_files()
+        if files:
+            self.emit('files-revert-requested', files)
 
     def _on_context_show_history(self, menu_item):
         """Handle Show History context menu action."""
@@ -239,37 +254,105 @@ class FileListWidget(Gtk.Box):
 
     def _get_status_label(self, status):
         """Get status label for a FileStatus."""
-        labels = {
-            FileStatus.MODIFIED: 'M',
-            FileStatus.ADDED: 'A',
-            FileStatus.DELETED: 'D',
-            FileStatus.RENAMED: 'R',
-            FileStatus.COPIED: 'C',
-            FileStatus.UNTRACKED: '?',
-            FileStatus.UNMERGED: 'U',
-        }
-        return labels.get(status, '?')
+        return _STATUS_LABELS.get(status, '?')
 
     def set_files(self, files):
-        """Update the file list."""
+        """Update the file list.
+
+        Rows are updated in place: rows for removed paths are deleted, new
+        paths are inserted at their position and changed entries are
+        rewritten, so unchanged rows (and the scroll position) survive a
+        rescan. If the list was empty or the relative order of existing
+        paths changed, the list is rebuilt instead.
+        """
         self._files = list(files)
-        self._store.clear()
+        if not self._files and not len(self._store):
+            # Already empty (e.g. clearing after a failed open)
+            return
+        if not len(self._store) or not self._update_rows():
+            self._rebuild_rows()
+        self._count_label.set_text(str(len(self._files)))
 
-        for i, file_change in enumerate(self._files):
-            status_label = self._get_status_label(file_change.status)
-            self._store.append([status_label, file_change.path, i])
+    def _update_rows(self):
+        """Merge self._files into the store.
+
+        Returns False, leaving the store to be rebuilt, if the order of
+        existing paths diverged or most rows would be new (e.g. switching
+        to the amend list), since inserting them one by one into the
+        attached model costs more than a detached rebuild.
+        """
+        store = self._store
+        new_paths = {f.path for f in self._files}
+        kept = sum(1 for row in store if row[1] in new_paths)
+        if len(new_paths) - kept > kept:
+            return False
+
+        # Drop rows whose paths are gone
+        remaining = set()
+        iter = store.get_iter_first()
+        while iter is not None:
+            path = store.get_value(iter, 1)
+            if path in new_paths:
+                remaining.add(path)
+                iter = store.iter_next(iter)
+            elif not store.remove(iter):
+                iter = None
+
+        # Walk the new list and the store together
+        iter = store.get_iter_first()
+        for file_change in self._files:
+            if iter is not None and store.get_value(iter, 1) == file_change.path:
+                if store.get_value(iter, 2) != file_change:
+                    store.set(iter, [0, 2], [
+                        self._get_status_label(file_change.status), file_change
+                    ])
+                remaining.discard(file_change.path)
+                iter = store.iter_next(iter)
+            elif file_change.path in remaining:
+                return False
+            else:
+                status_label = self._get_status_label(file_change.status)
+                store.insert_before(iter, [status_label, file_change.path, file_change])
+        return True
 
-        self._count_label.set_text(str(len(self._files)))
+    def _rebuild_rows(self):
+        """Replace every row in the store.
+
+        The store is detached from the view while it is refilled so the
+        view does not process each inserted row.
+        """
+        self._tree_view.set_model(None)
+        self._store.clear()
+        for file_change in self._files:
+            status_label = self._get_status_label(file_change.status)
+            self._store.insert_with_valuesv(-1, [0, 1, 2], [
+                status_label, file_change.path, file_change
+            ])
+        self._tree_view.set_model(self._store)
 
     def get_selected_file(self):
-        """Get the currently selected file."""
-        selection = self._tree_view.get_selection()
-        model, iter = selection.get_selected()
-        if iter:
-            idx = model.get_value(iter, 2)
-            if idx < len(self._files):
-                return self._files[idx]
-        return None
+        """Get the first selected file."""
+        files = self.get_selected_files()
+        return files[0] if files else None
+
+    def get_selected_files(self):
+        """Get all selected files in list order."""
+        model, paths = self._tree_view.get_selection().get_selected_rows()
+        return [model[path][2] for path in paths]
+
+    def select_file(self, path):
+        """Select the row for the given path.
+
+        Returns:
+            True if the path is in the list.
+        """
+        for row in self._store:
+            if row[1] == path:
+                selection = self._tree_view.get_selection()
+                selection.unselect_all()
+                selection.select_iter(row.iter)
+                return True
+        return False
 
     def clear_selection(self):
         """Clear the current selection."""
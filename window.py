@@ -1,16 +1,23 @@
 """Main application window."""
 
+import logging
 import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+import subprocess
 import threading
+import webbrowser
 import gi
 
 gi.require_version('Gtk', '3.0')
 
 from gi.repository import Gtk, GLib
 
-from cache import RecentRepositoryList
+from cache import RecentRepositoryList, StatusCache
 from widgets import FileListWidget, DiffView, CommitArea
-from actions import get_action_shortcut
+from actions import get_action_accel
+from utils import find_git_root
 from viewmodels.repository_vm import RepositoryViewModel
 from viewmodels.file_list_vm import FileListViewModel
 from viewmodels.diff_vm import DiffViewModel
@@ -20,6 +27,70 @@ from viewmodels.branch_vm import BranchViewModel
 import dialogs
 from dialogs.message import MessageType
 
+
+_log = logging.getLogger(__name__)
+
+# Short read-only git queries (status scans, diffs, amend data) run here;
+# nothing waits on their futures, so each job catches its own errors
+_GIT_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='git-io')
+
+
+def _on_main_thread(callback):
+    """Wrap a callback so it always runs on the GTK main thread.
+
+    Calls made from other threads are deferred with GLib.idle_add.
+    """
+    def dispatch(*args):
+        callback(*args)
+        return False
+
+    def wrapper(*args):
+        if threading.current_thread() is threading.main_thread():
+            callback(*args)
+        else:
+            GLib.idle_add(dispatch, *args)
+    return wrapper
+
+
+def _single_shot(name):
+    """Decorate a dialog handler so it is ignored while already running.
+
+    Modal dialogs run a nested main loop, so a second activation (e.g. a
+    keyboard shortcut pressed again) could otherwise stack a second copy
+    of the same dialog.
+    """
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(self, *args):
+            if name in self._dialog_busy:
+                return
+            self._dialog_busy.add(name)
+            try:
+                handler(self, *args)
+            finally:
+                self._dialog_busy.discard(name)
+        return wrapper
+    return decorator
+
+
+def _remote_ref_label(remote, branch):
+    """Return 'remote/branch', or just the remote name if branch is empty."""
+    return f'{remote}/{branch}' if branch else remote
+
+
+def _spawn_detached(args, cwd=None):
+    """Start an external program that runs independently of the GUI.
+
+    The child gets no stdio from the application and its own session, so
+    it neither writes into our terminal nor dies with it.
+    """
+    subprocess.Popen(
+        args, cwd=cwd,
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
 class GitGuiWindow(Gtk.ApplicationWindow):
     """Main application window."""
 
@@ -37,18 +108,102 @@ class GitGuiWindow(Gtk.ApplicationWindow):
         self._remote_vm = RemoteViewModel(self._repo_vm)
         self._branch_vm = BranchViewModel(self._repo_vm)
 
-        # Guard: ignore file-selection signals while refreshing lists
-        self._updating_file_lists = False
-
-        # Wire VM callbacks
-        self._repo_vm.on_state_changed = self._on_repo_state_changed
-        self._repo_vm.set_status = self._on_vm_status
+        # Background diff requests: only the latest result is displayed
+        self._diff_seq = 0
+        self._diff_request = None
+        # (file_change, staged) of the latest request; True until it is shown
+        self._diff_target = None
+        self._diff_loading = False
+
+        # Pending coalesced rescan (GLib source id) and whether it is forced
+        self._rescan_pending_id = 0
+        self._rescan_pending_force = False
+
+        # Status scans run on a worker thread, one at a time; a request
+        # made while one runs is queued to run after it
+        self._rescan_inflight = False
+        self._rescan_queued = False
+        self._rescan_queued_force = False
+        # (repo_path, unstaged, staged) last written to or read from the
+        # StatusCache; scans that match it are not saved again
+        self._saved_status = None
+
+        # Latest status bar text and the timer that writes it (GLib source id)
+        self._pending_status = None
+        self._status_timer = 0
+        # Text currently shown in the status bar
+        self._shown_status = ''
+
+        # Repository open in progress on a worker thread, and the path
+        # requested while it ran
+        self._opening = False
+        self._open_queued = None
+
+        # Whether amend data is being loaded on a worker thread
+        self._amend_loading = False
+
+        # Pending idle source that pushes VM state to the widgets, and the
+        # file lists (with amend mode for the staged one) last shown
+        self._state_apply_id = 0
+        self._applied_unstaged = []
+        self._applied_staged = ([], False)
+
+        # Branch name currently shown in the toolbar
+        self._last_branch = None
+
+        # Debounced diff context change: latest value and its timer
+        self._pending_context = None
+        self._context_timer = 0
+
+        # Names of _single_shot dialog handlers currently running
+        self._dialog_busy = set()
+
+        # Git operations queued by _run_async run one at a time on this thread
+        self._bg_queue = queue.Queue()
+        # Operation key -> token of the newest submission with that key
+        self._op_latest = {}
+        self._bg_thread = threading.Thread(target=self._bg_worker, name='git-ops')
+        self._bg_thread.daemon = True
+        self._bg_thread.start()
+        self.connect('destroy', lambda w: self._bg_queue.put(None))
+
+        # Wire VM callbacks (VM operations may run on the worker thread)
+        self._repo_vm.on_state_changed = _on_main_thread(self._on_repo_state_changed)
+        self._repo_vm.set_status = _on_main_thread(self._on_vm_status)
+        self._repo_vm.request_rescan = _on_main_thread(self._schedule_rescan)
+
+        # Open Recent submenu: last list shown and items reused across rebuilds
+        self._recent_cache = None
+        self._recent_items = {}
+        self._recent_empty_item = Gtk.MenuItem(label='(No recent repositories)')
+        self._recent_empty_item.set_sensitive(False)
+        self._recent_separator = Gtk.SeparatorMenuItem()
+        self._recent_clear_item = Gtk.MenuItem(label='Clear Recent')
+        self._recent_clear_item.connect('activate', self._on_clear_recent)
 
         self._setup_ui()
 
-        # Try to open current directory as repo
-        cwd = os.getcwd()
-        self.open_repository(cwd)
+        # Try to open current directory as repo once the window is drawn
+        self._pending_cwd = os.getcwd()
+        self._first_map_handler = self.connect('map-event', self._on_first_map)
+
+    def _on_first_map(self, widget, event):
+        """Schedule the initial repository open after the first paint."""
+        self.disconnect(self._first_map_handler)
+        GLib.idle_add(self._open_pending_cwd)
+        return False
+
+    def _open_pending_cwd(self):
+        """Open the startup directory unless a repository was opened already."""
+        path = self._pending_cwd
+        self._pending_cwd = None
+        if path is None:
+            return False
+        if find_git_root(path):
+            self.open_repository(path)
+        else:
+            self._set_status('Not a git repository: ' + path, MessageType.WARNING)
+        return False
 
     # --- VM callback handlers ---
 
@@ -57,33 +212,66 @@ class GitGuiWindow(Gtk.ApplicationWindow):
         self._set_status(message, MessageType.get_message_type(msg_type))
 
     def _on_repo_state_changed(self):
-        """Handle repository state changes — push VM state to widgets."""
+        """Handle repository state changes.
+
+        Several changes in one main loop iteration are pushed to the
+        widgets together by _apply_repo_state.
+        """
+        if not self._state_apply_id:
+            self._state_apply_id = GLib.idle_add(self._apply_repo_state)
+
+    def _apply_repo_state(self):
+        """Push VM state to widgets, skipping file lists that did not change."""
+        self._state_apply_id = 0
         vm = self._repo_vm
-        self._updating_file_lists = True
-        self._unstaged_list.set_files(vm.unstaged_files)
-        if self._commit_vm.amend_mode:
-            self._staged_list.set_files(
-                self._commit_vm.get_amend_staged_files(vm.staged_files)
-            )
-        else:
-            self._staged_list.set_files(vm.staged_files)
-        self._updating_file_lists = False
+        unstaged = vm.unstaged_files
+        staged = vm.staged_files
+
+        staged_key = (staged, self._commit_vm.amend_mode)
+        unstaged_changed = unstaged != self._applied_unstaged
+        staged_changed = staged_key != self._applied_staged
+        if unstaged_changed or staged_changed:
+            # Repopulating the lists must not look like a user selection
+            self._unstaged_list.handler_block_by_func(self._on_unstaged_file_selected)
+            self._staged_list.handler_block_by_func(self._on_staged_file_selected)
+            if unstaged_changed:
+                self._unstaged_list.set_files(unstaged)
+                self._applied_unstaged = unstaged
+            if staged_changed:
+                if self._commit_vm.amend_mode:
+                    self._staged_list.set_files(
+                        self._commit_vm.get_amend_staged_files(staged)
+                    )
+                else:
+                    self._staged_list.set_files(staged)
+                self._applied_staged = staged_key
+            if self._diff_request:
+                path, diff_staged = self._diff_request[:2]
+                file_list = self._staged_list if diff_staged else self._unstaged_list
+                file_list.select_file(path)
+            self._unstaged_list.handler_unblock_by_func(self._on_unstaged_file_selected)
+            self._staged_list.handler_unblock_by_func(self._on_staged_file_selected)
 
         branch = vm.branch_name
-        self._branch_label.set_text('  ' + branch if branch else '')
-        if branch:
-            self._visualize_branch_item.set_label(f"Visualize {branch}'s History")
+        if branch != self._last_branch:
+            self._last_branch = branch
+            self._branch_label.set_text('  ' + branch if branch else '')
+            if branch:
+                self._visualize_branch_item.set_label(f"Visualize {branch}'s History")
 
         if not self._commit_vm.amend_mode:
             self._commit_area.set_commit_sensitive(vm.has_staged_files)
 
-        # Clear diff if selected file is no longer in lists,
-        # otherwise refresh it so it reflects the current state.
-        if self._diff_vm.is_stale(vm.unstaged_files, vm.staged_files):
-            self._diff_vm.clear()
-            self._diff_view.clear()
-        elif self._diff_vm.refresh():
-            self._update_diff_view()
+        # Clear diff if selected file is no longer in lists, otherwise
+        # refresh it; the view is only redrawn if the result differs.
+        paths = {f.path for f in unstaged}
+        paths.update(f.path for f in staged)
+        self._diff_vm.invalidate_cache(paths, vm.head_sha)
+        if self._diff_vm.is_stale(paths):
+            self._clear_diff()
+        else:
+            self._refresh_diff()
+        return False
 
     # --- UI setup ---
 
@@ -100,6 +288,23 @@ class GitGuiWindow(Gtk.ApplicationWindow):
         'menu_about': 'about',
     }
 
+    # Menu item id -> parsed accelerator (key, mods), for items that have
+    # a shortcut; built once by _get_resolved_shortcuts() and shared by
+    # all windows
+    _resolved_shortcuts = None
+
+    @classmethod
+    def _get_resolved_shortcuts(cls):
+        """Return {widget_id: (key, mods)} for menu items with a shortcut."""
+        if cls._resolved_shortcuts is None:
+            resolved = {}
+            for widget_id, action_name in cls._MENU_SHORTCUTS.items():
+                accel = get_action_accel(action_name)
+                if accel:
+                    resolved[widget_id] = Gtk.accelerator_parse(accel)
+            cls._resolved_shortcuts = resolved
+        return cls._resolved_shortcuts
+
     def _setup_ui(self):
         """Set up the user interface."""
         builder = Gtk.Builder()
@@ -117,8 +322,11 @@ class GitGuiWindow(Gtk.ApplicationWindow):
         self._recent_menu_item = builder.get_object('menu_open_recent')
         self._recent_submenu = builder.get_object('recent_submenu')
 
-        # --- Shortcut labels on menu items ---
-        self._add_shortcut_labels(builder)
+        # --- Shortcut hints on menu items ---
+        # The item's own AccelLabel draws the hint; the shortcuts themselves
+        # are dispatched by the application's action accelerators
+        for widget_id, (key, mods) in self._get_resolved_shortcuts().items():
+            builder.get_object(widget_id).get_child().set_accel(key, mods)
 
         # --- Dynamic recent repos menu ---
         self._update_recent_menu()
@@ -135,17 +343,19 @@ class GitGuiWindow(Gtk.ApplicationWindow):
         file_lists_paned.pack2(self._staged_list, resize=True, shrink=False)
 
         # --- Signal connections: toolbar ---
-        builder.get_object('open_button').connect('clicked', lambda b: self.show_open_dialog())
-        builder.get_object('rescan_button').connect('clicked', lambda b: self.rescan())
+        builder.get_object('open_button').connect('clicked', self.show_open_dialog)
+        builder.get_object('rescan_button').connect('clicked', self.rescan)
 
         # --- Signal connections: file lists ---
         self._unstaged_list.connect('file-selected', self._on_unstaged_file_selected)
         self._unstaged_list.connect('file-activated', self._on_unstaged_file_activated)
-        self._unstaged_list.connect('file-revert-requested', self._on_file_revert_requested)
+        self._unstaged_list.connect('files-activated', self._on_unstaged_files_activated)
+        self._unstaged_list.connect('files-revert-requested', self._on_files_revert_requested)
         self._unstaged_list.connect('file-history-requested', self._on_file_history_requested)
 
         self._staged_list.connect('file-selected', self._on_staged_file_selected)
         self._staged_list.connect('file-activated', self._on_staged_file_activated)
+        self._staged_list.connect('files-activated', self._on_staged_files_activated)
         self._staged_list.connect('file-history-requested', self._on_file_history_requested)
 
         # --- Signal connections: diff view ---
@@ -159,95 +369,95 @@ class GitGuiWindow(Gtk.ApplicationWindow):
 
         # --- Signal connections: commit area ---
         self._commit_area.connect('commit-requested', self._on_commit_requested)
-        self._commit_area.connect('push-requested', lambda w: self.show_push_dialog())
-        self._commit_area.connect('rescan-requested', lambda w: self.rescan())
+        self._commit_area.connect('push-requested', self.show_push_dialog)
+        self._commit_area.connect('rescan-requested', self.rescan)
         self._commit_area.connect('amend-toggled', self._on_amend_toggled)
 
         # --- Signal connections: menu items ---
         menu_signals = {
-            'menu_open': lambda w: self.show_open_dialog(),
-            'menu_explore': lambda w: self.explore_repository(),
-            'menu_rescan': lambda w: self.rescan(),
-            'menu_visualize_branch': lambda w: self._visualize_branch_history(),
-            'menu_visualize_all': lambda w: self._visualize_all_history(),
-            'menu_db_stats': lambda w: self._show_database_statistics(),
-            'menu_db_compress': lambda w: self._compress_database(),
-            'menu_db_verify': lambda w: self._verify_database(),
-            'menu_show_logs': lambda w: self._show_logs_dialog(),
-            'menu_show_file_history': lambda w: self._show_file_history_dialog(),
+            'menu_open': self.show_open_dialog,
+            'menu_explore': self.explore_repository,
+            'menu_rescan': self.rescan,
+            'menu_visualize_branch': self._visualize_branch_history,
+            'menu_visualize_all': self._visualize_all_history,
+            'menu_db_stats': self._show_database_statistics,
+            'menu_db_compress': self._compress_database,
+            'menu_db_verify': self._verify_database,
+            'menu_show_logs': self._show_logs_dialog,
+            'menu_show_file_history': self._show_file_history_dialog,
             'menu_quit': lambda w: self.get_application().quit(),
-            'menu_create_branch': lambda w: self._show_create_branch_dialog(),
-            'menu_checkout_branch': lambda w: self._show_checkout_branch_dialog(),
-            'menu_rename_branch': lambda w: self._show_rename_branch_dialog(),
-            'menu_delete_branch': lambda w: self._show_delete_branch_dialog(),
-            'menu_reset_branch': lambda w: self._show_reset_branch_dialog(),
-            'menu_merge': lambda w: self._show_merge_dialog(),
-            'menu_rebase': lambda w: self._show_rebase_dialog(),
-            'menu_list_remotes': lambda w: self._show_list_remotes_dialog(),
-            'menu_add_remote': lambda w: self.show_add_remote_dialog(),
-            'menu_rename_remote': lambda w: self.show_rename_remote_dialog(),
-            'menu_delete_remote': lambda w: self.show_delete_remote_dialog(),
-            'menu_fetch': lambda w: self.show_fetch_dialog(),
-            'menu_pull': lambda w: self.show_pull_dialog(),
-            'menu_push': lambda w: self.show_push_dialog(),
-            'menu_git_docs': lambda w: self._open_git_documentation(),
-            'menu_ssh_key': lambda w: self._show_ssh_key(),
-            'menu_about': lambda w: self._show_about(),
+            'menu_create_branch': self._show_create_branch_dialog,
+            'menu_checkout_branch': self._show_checkout_branch_dialog,
+            'menu_rename_branch': self._show_rename_branch_dialog,
+            'menu_delete_branch': self._show_delete_branch_dialog,
+            'menu_reset_branch': self._show_reset_branch_dialog,
+            'menu_merge': self._show_merge_dialog,
+            'menu_rebase': self._show_rebase_dialog,
+            'menu_list_remotes': self._show_list_remotes_dialog,
+            'menu_add_remote': self.show_add_remote_dialog,
+            'menu_rename_remote': self.show_rename_remote_dialog,
+            'menu_delete_remote': self.show_delete_remote_dialog,
+            'menu_fetch': self.show_fetch_dialog,
+            'menu_pull': self.show_pull_dialog,
+            'menu_push': self.show_push_dialog,
+            'menu_git_docs': self._open_git_documentation,
+            'menu_ssh_key': self._show_ssh_key,
+            'menu_about': self._show_about,
         }
         for widget_id, handler in menu_signals.items():
             builder.get_object(widget_id).connect('activate', handler)
 
-        main_box.show_all()
-
-    def _add_shortcut_labels(self, builder):
-        """Replace plain labels on menu items with label + shortcut hint boxes."""
-        for widget_id, action_name in self._MENU_SHORTCUTS.items():
-            shortcut = get_action_shortcut(action_name)
-            if not shortcut:
-                continue
-            item = builder.get_object(widget_id)
-            label_text = item.get_label()
-            child = item.get_child()
-            item.remove(child)
-            box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-            label_widget = Gtk.Label(label=label_text)
-            label_widget.set_xalign(0)
-            box.pack_start(label_widget, True, True, 0)
-            shortcut_label = Gtk.Label(label=shortcut)
-            shortcut_label.get_style_context().add_class('dim-label')
-            box.pack_end(shortcut_label, False, False, 0)
-            item.add(box)
+        # Every widget is already visible (window.ui sets visible on all
+        # objects and the custom widgets show themselves), so no show_all()
+        # walk of the tree is needed before the window is presented.
 
     # --- Recent repositories ---
 
     def _update_recent_menu(self):
-        """Update the Open Recent submenu with recent repositories."""
-        # Clear existing items
-        for child in self._recent_submenu.get_children():
-            self._recent_submenu.remove(child)
+        """Update the Open Recent submenu with recent repositories.
 
+        Does nothing if the list is unchanged; otherwise a new submenu is
+        filled off-screen and swapped in. Existing menu items are reused,
+        and only new paths get new items.
+        """
         recent = RecentRepositoryList.get_recent()
+        if recent == self._recent_cache:
+            return
+        self._recent_cache = recent
+
+        # Detach the old submenu, then free the reusable items from it;
+        # the new submenu is filled off-screen and attached in one step
+        old_submenu = self._recent_submenu
+        self._recent_menu_item.set_submenu(None)
+        for child in old_submenu.get_children():
+            old_submenu.remove(child)
 
+        for path in list(self._recent_items):
+            if path not in recent:
+                del self._recent_items[path]
+
+        menu = Gtk.Menu()
         if not recent:
-            empty_item = Gtk.MenuItem(label='(No recent repositories)')
-            empty_item.set_sensitive(False)
-            self._recent_submenu.append(empty_item)
+            menu.append(self._recent_empty_item)
         else:
             for path in recent:
-                # Show just the directory name as label, full path as tooltip
-                label = os.path.basename(path) or path
-                item = Gtk.MenuItem(label=label)
-                item.set_tooltip_text(path)
-                item.connect('activate', self._on_recent_item_activated, path)
-                self._recent_submenu.append(item)
+                item = self._recent_items.get(path)
+                if item is None:
+                    # Show just the directory name as label, full path as tooltip
+                    label = os.path.basename(path) or path
+                    item = Gtk.MenuItem(label=label)
+                    item.set_tooltip_text(path)
+                    item.connect('activate', self._on_recent_item_activated, path)
+                    self._recent_items[path] = item
+                menu.append(item)
 
             # Add separator and clear option
-            self._recent_submenu.append(Gtk.SeparatorMenuItem())
-            clear_item = Gtk.MenuItem(label='Clear Recent')
-            clear_item.connect('activate', self._on_clear_recent)
-            self._recent_submenu.append(clear_item)
+            menu.append(self._recent_separator)
+            menu.append(self._recent_clear_item)
 
-        self._recent_submenu.show_all()
+        menu.show_all()
+        self._recent_menu_item.set_submenu(menu)
+        self._recent_submenu = menu
 
     def _on_recent_item_activated(self, widget, path):
         """Handle click on a recent repository item."""
@@ -260,124 +470,212 @@ class GitGuiWindow(Gtk.ApplicationWindow):
 
     # --- Pure UI actions ---
 
-    def _open_git_documentation(self):
+    def _open_git_documentation(self, widget=None):
         """Open Git documentation in default web browser."""
-        import webbrowser
         webbrowser.open('https://git-scm.com/doc')
 
-    def _show_ssh_key(self):
+    def _show_ssh_key(self, widget=None):
         """Show the user's SSH public key."""
         dialogs.show_ssh_key_dialog(self, on_status=lambda msg, t=MessageType.INFO: self._set_status(msg, t))
 
-    def _show_about(self):
+    def _show_about(self, widget=None):
         """Show the about dialog."""
         dialogs.show_about_dialog(self)
 
     # --- Repository operations ---
 
     def open_repository(self, path):
-        """Open a git repository."""
-        success = self._repo_vm.open_repository(path)
-        if success:
+        """Open a git repository.
+
+        The repository is opened on a worker thread. While one is being
+        opened, only the most recently requested path is kept and opened
+        next.
+        """
+        self._pending_cwd = None
+        if self._opening:
+            self._open_queued = path
+            return
+        self._opening = True
+        self._set_status(f'Opening {path}...')
+        _GIT_IO_POOL.submit(self._open_worker, path)
+
+    def _open_worker(self, path):
+        """Worker thread: open a repository and hand it to the main thread."""
+        loaded = cached = error = None
+        try:
+            loaded = self._repo_vm.load_repository(path)
+            if loaded is not None:
+                _, repo_path, _ = loaded
+                cached = (repo_path, *(StatusCache.load(repo_path) or ([], [])))
+        except Exception as e:
+            _log.exception('Opening %s failed', path)
+            loaded = cached = None
+            error = f'Failed to open {path}: {e}'
+        GLib.idle_add(self._on_repository_loaded, path, loaded, cached)
+        self._report_worker_error(error)
+
+    def _on_repository_loaded(self, path, loaded, cached):
+        """Make an opened repository current and start its first scan.
+
+        cached holds the (repo_path, unstaged, staged) lists saved in an
+        earlier session.
+        """
+        self._opening = False
+        queued, self._open_queued = self._open_queued, None
+        if queued is not None and queued != path:
+            # Superseded while it was being opened
+            self.open_repository(queued)
+            return False
+
+        if self._repo_vm.set_repository(path, loaded):
+            # Show the lists from the last session while the first scan runs
+            self._saved_status = cached
+            self._repo_vm.show_cached_status(*cached[1:])
+            self._start_rescan(force=True)
             self.set_title('Git GUI - ' + self._repo_vm.repo_name)
-            RecentRepositoryList.add_recent(self._repo_vm.repo_path)
-            self._update_recent_menu()
+            if RecentRepositoryList.add_recent(self._repo_vm.repo_path):
+                self._update_recent_menu()
         else:
             self._clear_ui()
+        return False
 
     def _clear_ui(self):
         """Clear all UI elements."""
         self._unstaged_list.set_files([])
         self._staged_list.set_files([])
-        self._diff_vm.clear()
-        self._diff_view.clear()
-        self._branch_label.set_text('')
+        self._applied_unstaged = []
+        self._applied_staged = ([], False)
+        self._clear_diff()
+        self._diff_vm.invalidate_cache()
+        if self._last_branch:
+            self._branch_label.set_text('')
+            self._last_branch = ''
         self._commit_area.set_commit_sensitive(False)
 
-    def rescan(self):
+    def rescan(self, widget=None):
         """Rescan the repository for changes."""
-        self._repo_vm.rescan()
+        self._start_rescan(force=True)
 
-    def explore_repository(self):
+    def _schedule_rescan(self, force=False, delay_ms=50):
+        """Coalesce rescan requests into one rescan after a short delay."""
+        if self._repo_vm.repo is None:
+            return
+        self._rescan_pending_force = self._rescan_pending_force or force
+        if self._rescan_pending_id:
+            GLib.source_remove(self._rescan_pending_id)
+        self._rescan_pending_id = GLib.timeout_add(delay_ms, self._do_scheduled_rescan)
+
+    def _do_scheduled_rescan(self):
+        """Run the rescan requested through _schedule_rescan."""
+        force = self._rescan_pending_force
+        self._rescan_pending_id = 0
+        self._rescan_pending_force = False
+        self._start_rescan(force)
+        return False
+
+    def _start_rescan(self, force=False):
+        """Collect repository status on a worker thread."""
+        if self._repo_vm.repo is None:
+            return
+        if self._rescan_inflight:
+            # The running scan may predate the change; scan again after it
+            self._rescan_queued = True
+            self._rescan_queued_force = self._rescan_queued_force or force
+            return
+        self._rescan_inflight = True
+        _GIT_IO_POOL.submit(self._rescan_worker, force)
+
+    def _rescan_worker(self, force):
+        """Worker thread: run git status and hand the result to the main thread."""
+        result = error = None
+        try:
+            result = self._repo_vm.collect_status(force)
+        except Exception as e:
+            _log.exception('Status scan failed')
+            error = f'Rescan failed: {e}'
+        # Always delivered, so the in-flight flag is cleared
+        GLib.idle_add(self._on_rescan_collected, result)
+        self._report_worker_error(error)
+        if result is not None:
+            repo, _, unstaged, staged = result[:4]
+            status = (repo.working_dir, unstaged, staged)
+            if status != self._saved_status:
+                StatusCache.save(*status)
+                self._saved_status = status
+
+    def _on_rescan_collected(self, result):
+        """Apply a status scan on the main thread and start any queued one."""
+        self._repo_vm.apply_status(result)
+        self._rescan_inflight = False
+        if self._rescan_queued:
+            force = self._rescan_queued_force
+            self._rescan_queued = False
+            self._rescan_queued_force = False
+            self._start_rescan(force)
+        return False
+
+    def explore_repository(self, widget=None):
         """Open repository root in default file browser."""
         if not self._repo_vm.repo_path:
             self._set_status('No repository open', MessageType.WARNING)
             return
         try:
-            import subprocess
-            subprocess.Popen(['xdg-open', self._repo_vm.repo_path])
+            _spawn_detached(['xdg-open', self._repo_vm.repo_path])
         except Exception as e:
             self._show_error('Explore Repository', f'Failed to open file browser: {e}')
 
-    def _visualize_branch_history(self):
+    def _visualize_branch_history(self, widget=None):
         """Show branch history using the logs dialog."""
         self._show_logs_dialog()
 
-    def _visualize_all_history(self):
+    def _visualize_all_history(self, widget=None):
         """Open gitk to visualize all branches history."""
         if not self._repo_vm.repo_path:
             self._set_status('No repository open', MessageType.WARNING)
             return
         try:
-            import subprocess
-            subprocess.Popen(['gitk', '--all'], cwd=self._repo_vm.repo_path)
+            _spawn_detached(['gitk', '--all'], cwd=self._repo_vm.repo_path)
         except FileNotFoundError:
             self._show_error('Visualize History', 'gitk is not installed. Please install gitk to visualize history.')
         except Exception as e:
             self._show_error('Visualize History', f'Failed to open gitk: {e}')
 
-    def _show_database_statistics(self):
+    def _show_database_statistics(self, widget=None):
         """Show git database statistics."""
         if not self._repo_vm.repo_path:
             self._set_status('No repository open', MessageType.WARNING)
             return
         dialogs.show_database_statistics_dialog(self, self._repo_vm.repo)
 
-    def _compress_database(self):
+    def _compress_database(self, widget=None):
         """Compress git database (git gc)."""
         if not self._repo_vm.repo_path:
             self._set_status('No repository open', MessageType.WARNING)
             return
         self._set_status('Compressing database...')
-        dialogs.show_compress_database_dialog(
-            self, self._repo_vm.repo,
-            on_complete=lambda success, msg: self._set_status(
-                msg, MessageType.INFO if success else MessageType.ERROR
-            )
-        )
+        operation, finish = dialogs.show_compress_database_dialog(self, self._repo_vm.repo)
+        self._run_async(operation, finish)
 
-    def _verify_database(self):
+    def _verify_database(self, widget=None):
         """Verify git database (git fsck)."""
         if not self._repo_vm.repo_path:
             self._set_status('No repository open', MessageType.WARNING)
             return
         self._set_status('Verifying database...')
-        dialogs.show_verify_database_dialog(
-            self, self._repo_vm.repo,
-            on_complete=lambda success, msg: self._set_status(
-                'Database verification completed' if success else 'Database verification found issues'
-            )
-        )
+        operation, finish = dialogs.show_verify_database_dialog(self, self._repo_vm.repo)
+        self._run_async(operation, finish)
 
     # --- File selection handlers ---
 
     def _on_unstaged_file_selected(self, widget, file_change):
         """Handle unstaged file selection."""
-        if self._updating_file_lists:
-            return
         self._staged_list.clear_selection()
-        self._diff_vm.show_diff(file_change, staged=False,
-                                context_lines=self._diff_view.get_context_lines())
-        self._update_diff_view()
+        self._show_diff(file_change, staged=False)
 
     def _on_staged_file_selected(self, widget, file_change):
         """Handle staged file selection."""
-        if self._updating_file_lists:
-            return
         self._unstaged_list.clear_selection()
-        self._diff_vm.show_diff(file_change, staged=True,
-                                context_lines=self._diff_view.get_context_lines())
-        self._update_diff_view()
+        self._show_diff(file_change, staged=True)
 
     def _on_unstaged_file_activated(self, widget, file_change):
         """Handle unstaged file double-click (stage)."""
@@ -393,15 +691,31 @@ class GitGuiWindow(Gtk.ApplicationWindow):
         else:
             self._file_list_vm.unstage_file(file_change)
 
-    def _on_file_revert_requested(self, widget, file_change):
+    def _on_unstaged_files_activated(self, widget, files):
+        """Handle stage request for the selected files."""
+        self._file_list_vm.stage_files(files)
+
+    def _on_staged_files_activated(self, widget, files):
+        """Handle unstage request for the selected files."""
+        self._file_list_vm.unstage_files(files)
+
+    def _on_files_revert_requested(self, widget, files):
         """Handle revert request from context menu."""
-        if not file_change:
+        self._revert_files(files)
+
+    def _revert_files(self, files):
+        """Revert files after a single confirmation."""
+        if not files:
             return
-        if self._confirm_revert('Revert Changes?',
-                                'This will discard all changes to:\n{}\n\n'
-                                'This action cannot be undone.'.format(file_change.path),
-                                'Revert'):
-            self._file_list_vm.revert_file(file_change.path)
+        paths = [f.path for f in files]
+        listed = '\n'.join(paths[:10])
+        if len(paths) > 10:
+            listed += '\n... and {} more'.format(len(paths) - 10)
+        self._confirm_revert('Revert Changes?',
+                             'This will discard all changes to:\n{}\n\n'
+                             'This action cannot be undone.'.format(listed),
+                             'Revert',
+                             partial(self._file_list_vm.revert_files, paths))
 
     def _on_file_history_requested(self, widget, file_change):
         """Handle show history request from context menu."""
@@ -409,6 +723,90 @@ class GitGuiWindow(Gtk.ApplicationWindow):
             return
         dialogs.show_file_history_dialog(self, self._repo_vm.repo, file_change.path)
 
+    def _show_diff(self, file_change, staged):
+        """Load the diff for a file in the background and display it.
+
+        Results of superseded requests (e.g. while arrowing through the
+        file list) are dropped. Re-selecting the diff already shown (or
+        being loaded) does nothing; rescans refresh it separately.
+        """
+        key = (file_change.path, staged, file_change.status, self._diff_vm.amend_mode)
+        if key == self._diff_request:
+            return
+        self._diff_request = key
+        self._diff_target = (file_change, staged)
+        self._diff_loading = True
+        self._diff_seq += 1
+        self._diff_vm.context_lines = self._diff_view.get_context_lines()
+        self._diff_view.set_loading(file_change.path)
+        _GIT_IO_POOL.submit(self._diff_worker, self._diff_seq, file_change, staged)
+
+    def _refresh_diff(self):
+        """Reload the requested diff in the background (after a rescan or
+        a context line change).
+
+        A diff still being loaded is requested again, since the running
+        load may predate the change; a diff already shown is only redrawn
+        if it changed.
+
+        Returns True if there was a diff to reload.
+        """
+        if self._diff_target is None:
+            return False
+        file_change, staged = self._diff_target
+        self._diff_seq += 1
+        _GIT_IO_POOL.submit(self._diff_worker, self._diff_seq, file_change, staged)
+        return True
+
+    def _diff_worker(self, seq, file_change, staged):
+        """Compute a diff off the main thread."""
+        if seq != self._diff_seq:
+            # Superseded while waiting for a free worker
+            return
+        try:
+            diff_text = self._diff_vm.load_diff(file_change, staged)
+        except Exception as e:
+            _log.exception('Loading the diff of %s failed', file_change.path)
+            error = f'Failed to load diff: {e}'
+            GLib.idle_add(self._on_diff_ready, seq, file_change, staged, error, True)
+            self._report_worker_error(error)
+            return
+        GLib.idle_add(self._on_diff_ready, seq, file_change, staged, diff_text)
+
+    def _report_worker_error(self, message):
+        """Show a pool job's error in the status bar (no-op for None).
+
+        Called after the job has queued its result, so the message is not
+        replaced by the status that result posts.
+        """
+        if message is not None:
+            _on_main_thread(self._set_status)(message, MessageType.ERROR)
+
+    def _on_diff_ready(self, seq, file_change, staged, diff_text, failed=False):
+        """Display a computed diff unless a newer request was issued."""
+        if seq != self._diff_seq:
+            return False
+        vm = self._diff_vm
+        shown = (vm.current_file, vm.is_staged, vm.diff_text, vm.status_text)
+        vm.set_diff(file_change, staged, diff_text)
+        if failed:
+            # Selecting the file again retries the load
+            self._diff_request = None
+        if self._diff_loading or (vm.current_file, vm.is_staged,
+                                  vm.diff_text, vm.status_text) != shown:
+            self._update_diff_view()
+        self._diff_loading = False
+        return False
+
+    def _clear_diff(self):
+        """Clear the diff and drop any in-flight diff request."""
+        self._diff_request = None
+        self._diff_target = None
+        self._diff_loading = False
+        self._diff_seq += 1
+        self._diff_vm.clear()
+        self._diff_view.clear()
+
     def _update_diff_view(self):
         """Push current DiffViewModel state to the DiffView widget."""
         vm = self._diff_vm
@@ -430,49 +828,56 @@ class GitGuiWindow(Gtk.ApplicationWindow):
         self._diff_vm.unstage_lines(file_path, start_line, end_line)
 
     def _on_revert_hunk(self, widget, file_path, line):
-        if self._confirm_revert('Revert Hunk?',
-                                f'This will discard changes in the selected hunk from:\n{file_path}\n\n'
-                                'This action cannot be undone.',
-                                'Revert Hunk'):
-            self._diff_vm.revert_hunk(file_path, line)
+        self._confirm_revert('Revert Hunk?',
+                             f'This will discard changes in the selected hunk from:\n{file_path}\n\n'
+                             'This action cannot be undone.',
+                             'Revert Hunk',
+                             partial(self._diff_vm.revert_hunk, file_path, line))
 
     def _on_revert_lines(self, widget, file_path, start_line, end_line):
-        if self._confirm_revert('Revert Lines?',
-                                f'This will discard the selected line change from:\n{file_path}\n\n'
-                                'This action cannot be undone.',
-                                'Revert Lines'):
-            self._diff_vm.revert_lines(file_path, start_line, end_line)
+        self._confirm_revert('Revert Lines?',
+                             f'This will discard the selected line change from:\n{file_path}\n\n'
+                             'This action cannot be undone.',
+                             'Revert Lines',
+                             partial(self._diff_vm.revert_lines, file_path, start_line, end_line))
 
     def _on_context_changed(self, widget, context_lines):
-        """Handle context lines change from diff view."""
+        """Handle context lines change from diff view.
+
+        Rapid changes (holding the spinner arrow) are debounced so only
+        the final value regenerates the diff.
+        """
+        self._pending_context = context_lines
+        if self._context_timer:
+            GLib.source_remove(self._context_timer)
+        self._context_timer = GLib.timeout_add(120, self._flush_context)
+
+    def _flush_context(self):
+        """Regenerate the diff with the latest context line count."""
+        self._context_timer = 0
+        context_lines = self._pending_context
         self._diff_vm.context_lines = context_lines
-        if self._diff_vm.refresh():
-            self._update_diff_view()
+        if self._refresh_diff():
             self._set_status(f'Context lines: {context_lines}')
+        return GLib.SOURCE_REMOVE
 
     # --- Staging operations (thin delegation for actions.py) ---
 
     def stage_selected(self):
-        """Stage the currently selected file."""
-        file_change = self._unstaged_list.get_selected_file()
-        if file_change:
-            self._file_list_vm.stage_file(file_change)
+        """Stage the currently selected files."""
+        files = self._unstaged_list.get_selected_files()
+        if files:
+            self._file_list_vm.stage_files(files)
 
     def unstage_selected(self):
-        """Unstage the currently selected file."""
-        file_change = self._staged_list.get_selected_file()
-        if file_change:
-            self._file_list_vm.unstage_file(file_change)
+        """Unstage the currently selected files."""
+        files = self._staged_list.get_selected_files()
+        if files:
+            self._file_list_vm.unstage_files(files)
 
     def revert_selected(self):
-        """Revert the currently selected file."""
-        file_change = self._unstaged_list.get_selected_file()
-        if file_change:
-            if self._confirm_revert('Revert Changes?',
-                                    'This will discard all changes to:\n{}\n\n'
-                                    'This cannot be undone.'.format(file_change.path),
-                                    'Revert'):
-                self._file_list_vm.revert_file(file_change.path)
+        """Revert the currently selected files."""
+        self._revert_files(self._unstaged_list.get_selected_files())
 
     def stage_all(self):
         """Stage all unstaged files."""
@@ -495,17 +900,47 @@ class GitGuiWindow(Gtk.ApplicationWindow):
             self._show_error('Commit Error', result_msg)
 
     def _on_amend_toggled(self, widget, amend_enabled):
-        """Handle amend checkbox toggle."""
+        """Handle amend checkbox toggle.
+
+        Entering amend mode reads the last commit on a worker thread; the
+        checkbox is disabled until the result is applied.
+        """
         self._diff_vm.amend_mode = amend_enabled
         if amend_enabled:
-            last_msg, files = self._commit_vm.get_amend_data()
-            self._commit_area.set_message(last_msg)
-            self._staged_list.set_files(files)
-            self._commit_area.set_commit_sensitive(True)
+            self._amend_loading = True
+            self._commit_area.set_amend_sensitive(False)
+            _GIT_IO_POOL.submit(self._amend_worker)
         else:
             self._commit_vm.leave_amend_mode()
             self._commit_area.clear_message()
 
+    def _amend_worker(self):
+        """Worker thread: load the last commit for amend mode."""
+        result = error = None
+        try:
+            result = self._commit_vm.load_amend_data()
+        except Exception as e:
+            _log.exception('Loading the last commit failed')
+            error = f'Failed to load the last commit: {e}'
+        # Always delivered, so the amend checkbox is re-enabled
+        GLib.idle_add(self._on_amend_data_ready, result)
+        self._report_worker_error(error)
+
+    def _on_amend_data_ready(self, result):
+        """Apply the amend data loaded by _amend_worker."""
+        self._amend_loading = False
+        self._commit_area.set_amend_sensitive(True)
+        if result is None:
+            self._commit_area.set_amend_mode(False)
+            return False
+        last_msg, files = result
+        self._commit_vm.amend_mode = True
+        self._commit_area.set_message(last_msg)
+        self._staged_list.set_files(files)
+        self._applied_staged = None
+        self._commit_area.set_commit_sensitive(True)
+        return False
+
     def commit(self, message=None, amend=None, sign_off=None):
         """Perform a commit (called from actions.py)."""
         if message is None:
@@ -523,184 +958,291 @@ class GitGuiWindow(Gtk.ApplicationWindow):
             self._show_error('Commit Error', result_msg)
 
     def toggle_amend(self):
-        """Toggle amend mode (called from actions.py)."""
-        enabled, last_msg, files = self._commit_vm.toggle_amend()
-        self._diff_vm.amend_mode = enabled
-        if enabled:
-            self._commit_area.set_amend_mode(True)
-            self._commit_area.set_message(last_msg)
-        else:
-            self._commit_area.set_amend_mode(False)
-            self._commit_area.clear_message()
+        """Toggle amend mode (called from actions.py).
+
+        Flips the checkbox; _on_amend_toggled does the rest.
+        """
+        if not self._amend_loading:
+            self._commit_area.set_amend_mode(not self._commit_area.is_amend_mode())
 
     # --- Remote operations (async wrappers) ---
 
-    def show_push_dialog(self):
+    @_single_shot('push')
+    def show_push_dialog(self, widget=None):
         """Show dialog to push to a remote."""
-        result = dialogs.show_push_dialog(self, self._repo_vm.repo)
+        result = dialogs.show_push_dialog(
+            self, self._repo_vm.repo,
+            remotes=self._remote_vm.get_remote_names(),
+            tracking_remote=self._remote_vm.get_tracking_remote(),
+            current_branch=self._repo_vm.branch_name
+        )
         if result:
             remote, branch, force, tags = result
-            branch_display = f'{remote}/{branch}' if branch else remote
-            self._set_status(f'Pushing to {branch_display}...')
+            self._set_status(f'Pushing to {_remote_ref_label(remote, branch)}...')
             self._run_async(
-                lambda: self._remote_vm.push(remote, branch, force, tags),
-                lambda s, m: self._show_error('Push Error', m) if not s else None
+                partial(self._remote_vm.push, remote, branch, force, tags),
+                partial(self._show_failure, 'Push Error'),
+                key=('push', remote, branch, force, tags)
             )
 
-    def show_pull_dialog(self):
+    @_single_shot('pull')
+    def show_pull_dialog(self, widget=None):
         """Show dialog to pull from a remote."""
-        result = dialogs.show_pull_dialog(self, self._repo_vm.repo)
+        result = dialogs.show_pull_dialog(
+            self, self._repo_vm.repo,
+            remotes=self._remote_vm.get_remote_names(),
+            tracking_remote=self._remote_vm.get_tracking_remote(),
+            current_branch=self._repo_vm.branch_name
+        )
         if result:
             remote, branch, ff_only, rebase = result
-            branch_display = f'{remote}/{branch}' if branch else remote
-            self._set_status(f'Pulling from {branch_display}...')
+            self._set_status(f'Pulling from {_remote_ref_label(remote, branch)}...')
             self._run_async(
-                lambda: self._remote_vm.pull(remote, branch, ff_only, rebase),
-                lambda s, m: self._show_error('Pull Error', m) if not s else None
+                partial(self._remote_vm.pull, remote, branch, ff_only, rebase),
+                partial(self._show_failure, 'Pull Error'),
+                key=('pull', remote, branch, ff_only, rebase)
             )
 
-    def show_fetch_dialog(self):
+    @_single_shot('fetch')
+    def show_fetch_dialog(self, widget=None):
         """Show dialog to fetch from a remote."""
-        result = dialogs.show_fetch_dialog(self, self._repo_vm.repo)
+        result = dialogs.show_fetch_dialog(
+            self, self._repo_vm.repo,
+            remotes=self._remote_vm.get_remote_names(),
+            tracking_remote=self._remote_vm.get_tracking_remote()
+        )
         if result:
             self._set_status(f'Fetching from {result}...')
             self._run_async(
-                lambda: self._remote_vm.fetch(result),
-                lambda s, m: self._show_error('Fetch Error', m) if not s else None
+                partial(self._remote_vm.fetch, result),
+                partial(self._show_failure, 'Fetch Error'),
+                key=('fetch', result)
             )
 
-    def _run_async(self, operation, on_complete):
-        """Run an operation in a background thread, dispatch result to main thread.
+    def _run_async(self, operation, on_complete, key=None):
+        """Run an operation in the background, dispatch result to main thread.
+
+        Operations are queued and run one at a time, in submission order,
+        so concurrent remote operations never race on the same repository.
 
         Args:
             operation: callable returning (success, message)
             on_complete: callable(success, message) run on the main thread
+            key: optional hashable identifying the operation (e.g.
+                ('fetch', remote)); a queued operation is skipped if a
+                newer one with the same key was submitted after it
         """
-        def worker():
-            success, message = operation()
-            GLib.idle_add(self._on_async_complete, success, message, on_complete)
+        token = object()
+        if key is not None:
+            self._op_latest[key] = token
+        self._bg_queue.put((operation, on_complete, key, token))
 
-        thread = threading.Thread(target=worker)
-        thread.daemon = True
-        thread.start()
+    def _bg_worker(self):
+        """Background thread loop: run queued operations one at a time.
 
-    def _on_async_complete(self, success, message, on_complete):
+        Exits when it receives None (queued when the window is destroyed).
+        """
+        while True:
+            job = self._bg_queue.get()
+            if job is None:
+                return
+            operation, on_complete, key, token = job
+            if key is not None and self._op_latest.get(key) is not token:
+                # Superseded by a newer identical request still in the queue
+                continue
+            try:
+                success, message = operation()
+            except Exception as e:
+                # Keep the worker alive for later operations
+                success, message = False, str(e)
+            GLib.idle_add(self._on_async_complete, success, message, on_complete, key, token)
+
+    def _on_async_complete(self, success, message, on_complete, key=None, token=None):
         """Handle async operation completion on the main thread."""
+        if key is not None and self._op_latest.get(key) is token:
+            del self._op_latest[key]
         self._set_status(message)
         if on_complete:
             on_complete(success, message)
 
     # --- Remote CRUD ---
 
-    def show_add_remote_dialog(self):
+    def show_add_remote_dialog(self, widget=None):
         """Show dialog to add a new remote."""
-        result = dialogs.show_add_remote_dialog(self, self._repo_vm.repo)
-        if result:
-            name, url, fetch_after = result
-            success, message = self._remote_vm.add_remote(name, url)
-            self._set_status(message)
-            if not success:
-                self._show_error('Add Remote Error', message)
-            elif fetch_after:
-                self._set_status(f'Fetching from {name}...')
-                self._run_async(
-                    lambda: self._remote_vm.fetch(name),
-                    lambda s, m: self._show_error('Fetch Error', m) if not s else None
-                )
-
-    def show_rename_remote_dialog(self):
+        dialogs.show_add_remote_dialog(
+            self, self._repo_vm.repo, self._add_remote,
+            remotes=self._remote_vm.get_remote_names()
+        )
+
+    def _add_remote(self, result):
+        """Add the remote chosen in the Add Remote dialog."""
+        name, url, fetch_after = result
+        if fetch_after:
+            self._set_status(f'Adding and fetching remote {name}...')
+        else:
+            self._set_status(f'Adding remote {name}...')
+        self._run_async(
+            partial(self._remote_vm.add_remote, name, url, fetch=fetch_after),
+            partial(self._show_failure, 'Add Remote Error')
+        )
+
+    @_single_shot('rename-remote')
+    def show_rename_remote_dialog(self, widget=None):
         """Show dialog to rename a remote."""
-        result = dialogs.show_rename_remote_dialog(self, self._repo_vm.repo)
+        result = dialogs.show_rename_remote_dialog(
+            self, self._repo_vm.repo,
+            remotes=self._remote_vm.get_remote_names(),
+            tracking_remote=self._remote_vm.get_tracking_remote()
+        )
         if result:
             old_name, new_name = result
-            success, message = self._remote_vm.rename_remote(old_name, new_name)
-            self._set_status(message)
-            if not success:
-                self._show_error('Rename Remote Error', message)
-
-    def show_delete_remote_dialog(self):
-        """Show dialog to delete a remote."""
-        result = dialogs.show_delete_remote_dialog(self, self._repo_vm.repo)
+            self._set_status(f'Renaming remote {old_name}...')
+            self._run_async(
+                partial(self._remote_vm.rename_remote, old_name, new_name),
+                partial(self._show_failure, 'Rename Remote Error')
+            )
+
+    @_single_shot('delete-remote')
+    def show_delete_remote_dialog(self, widget=None):
+        """Show dialog to delete one or more remotes."""
+        result = dialogs.show_delete_remote_dialog(
+            self, self._repo_vm.repo,
+            remotes=self._remote_vm.get_remote_names()
+        )
         if result:
-            success, message = self._remote_vm.delete_remote(result)
-            self._set_status(message)
-            if not success:
-                self._show_error('Delete Remote Error', message)
+            self._set_status(f'Deleting remote {", ".join(result)}...')
+            self._run_async(
+                partial(self._remote_vm.delete_remotes, result),
+                partial(self._show_failure, 'Delete Remote Error')
+            )
 
     # --- Branch dialogs ---
 
-    def _show_create_branch_dialog(self):
-        result = dialogs.show_create_branch_dialog(self, self._repo_vm.repo)
+    @_single_shot('create-branch')
+    def _show_create_branch_dialog(self, widget=None):
+        result = dialogs.show_create_branch_dialog(
+            self, self._repo_vm.repo,
+            branches=self._repo_vm.get_branches(),
+            current_branch=self._repo_vm.branch_name
+        )
         if result:
             branch_name, base, checkout = result
-            success, message = self._branch_vm.create_branch(branch_name, base, checkout)
-            if not success:
-                self._show_error('Create Branch Error', message)
+            self._set_status(f'Creating branch {branch_name}...')
+            self._run_async(
+                partial(self._branch_vm.create_branch, branch_name, base, checkout),
+                partial(self._show_failure, 'Create Branch Error')
+            )
 
-    def _show_checkout_branch_dialog(self):
-        result = dialogs.show_checkout_branch_dialog(self, self._repo_vm.repo)
+    @_single_shot('checkout-branch')
+    def _show_checkout_branch_dialog(self, widget=None):
+        result = dialogs.show_checkout_branch_dialog(
+            self, self._repo_vm.repo,
+            branches=self._repo_vm.get_branches(),
+            current_branch=self._repo_vm.branch_name
+        )
         if result:
-            success, message = self._branch_vm.checkout_branch(result)
-            if not success:
-                self._show_error('Checkout Branch Error', message)
+            self._set_status(f'Checking out {result}...')
+            self._run_async(
+                partial(self._branch_vm.checkout_branch, result),
+                partial(self._show_failure, 'Checkout Branch Error')
+            )
 
-    def _show_rename_branch_dialog(self):
-        result = dialogs.show_rename_branch_dialog(self, self._repo_vm.repo)
+    @_single_shot('rename-branch')
+    def _show_rename_branch_dialog(self, widget=None):
+        result = dialogs.show_rename_branch_dialog(
+            self, self._repo_vm.repo,
+            branches=self._repo_vm.get_branches(),
+            current_branch=self._repo_vm.branch_name
+        )
         if result:
             old_name, new_name = result
-            success, message = self._branch_vm.rename_branch(old_name, new_name)
-            if not success:
-                self._show_error('Rename Branch Error', message)
+            self._set_status(f'Renaming branch {old_name}...')
+            self._run_async(
+                partial(self._branch_vm.rename_branch, old_name, new_name),
+                partial(self._show_failure, 'Rename Branch Error')
+            )
 
-    def _show_delete_branch_dialog(self):
-        result = dialogs.show_delete_branch_dialog(self, self._repo_vm.repo)
+    @_single_shot('delete-branch')
+    def _show_delete_branch_dialog(self, widget=None):
+        result = dialogs.show_delete_branch_dialog(
+            self, self._repo_vm.repo,
+            branches=self._repo_vm.get_branches(),
+            current_branch=self._repo_vm.branch_name
+        )
         if result:
-            branch_name, force = result
-            success, message = self._branch_vm.delete_branch(branch_name, force)
-            if not success:
-                self._show_error('Delete Branch Error', message)
+            branch_names, force = result
+            self._set_status(f'Deleting branch {", ".join(branch_names)}...')
+            self._run_async(
+                partial(self._branch_vm.delete_branches, branch_names, force),
+                partial(self._show_failure, 'Delete Branch Error')
+            )
 
-    def _show_reset_branch_dialog(self):
-        result = dialogs.show_reset_branch_dialog(self, self._repo_vm.repo)
-        if result:
-            target, mode = result
-            success, message = self._branch_vm.reset_branch(target, mode)
-            if not success:
-                self._show_error('Reset Branch Error', message)
+    def _show_reset_branch_dialog(self, widget=None):
+        dialogs.show_reset_branch_dialog(
+            self, self._repo_vm.repo, self._reset_branch,
+            current_branch=self._repo_vm.branch_name
+        )
 
-    def _show_merge_dialog(self):
-        result = dialogs.show_merge_dialog(self, self._repo_vm.repo)
+    def _reset_branch(self, result):
+        """Reset the branch as chosen in the Reset Branch dialog."""
+        target, mode = result
+        self._set_status(f'Resetting to {target}...')
+        self._run_async(
+            partial(self._branch_vm.reset_branch, target, mode),
+            partial(self._show_failure, 'Reset Branch Error')
+        )
+
+    @_single_shot('merge')
+    def _show_merge_dialog(self, widget=None):
+        result = dialogs.show_merge_dialog(
+            self, self._repo_vm.repo,
+            branches=self._repo_vm.get_branches(),
+            current_branch=self._repo_vm.branch_name
+        )
         if result:
             branch, strategy = result
-            success, message = self._branch_vm.merge_branch(branch, strategy)
-            self._show_status_dialog('Merge', message, success)
+            self._set_status(f'Merging {branch}...')
+            busy = dialogs.show_busy_dialog(self, 'Merge', f'Merging {branch}...')
+            self._run_async(
+                partial(self._branch_vm.merge_branch, branch, strategy),
+                partial(self._close_busy_dialog, busy, 'Merge Error')
+            )
 
-    def _show_rebase_dialog(self):
-        result = dialogs.show_rebase_dialog(self, self._repo_vm.repo)
+    @_single_shot('rebase')
+    def _show_rebase_dialog(self, widget=None):
+        result = dialogs.show_rebase_dialog(
+            self, self._repo_vm.repo,
+            branches=self._repo_vm.get_branches(),
+            current_branch=self._repo_vm.branch_name
+        )
         if result:
-            success, message = self._branch_vm.rebase_branch(result)
-            self._show_status_dialog('Rebase', message, success)
+            self._set_status(f'Rebasing onto {result}...')
+            busy = dialogs.show_busy_dialog(self, 'Rebase', f'Rebasing onto {result}...')
+            self._run_async(
+                partial(self._branch_vm.rebase_branch, result),
+                partial(self._close_busy_dialog, busy, 'Rebase Error')
+            )
 
-    def _show_logs_dialog(self):
+    def _show_logs_dialog(self, widget=None):
         if not self._repo_vm.repo_path:
             self._set_status('No repository open', MessageType.WARNING)
             return
         dialogs.show_logs_dialog(self, self._repo_vm.repo)
 
-    def _show_file_history_dialog(self):
+    def _show_file_history_dialog(self, widget=None):
         if not self._repo_vm.repo_path:
             self._set_status('No repository open', MessageType.WARNING)
             return
         dialogs.show_file_history_dialog(self, self._repo_vm.repo, None)
 
-    def _show_list_remotes_dialog(self):
+    def _show_list_remotes_dialog(self, widget=None):
         dialogs.show_list_remotes_dialog(self, self._repo_vm.repo)
 
-    def show_open_dialog(self):
+    def show_open_dialog(self, widget=None):
         """Show dialog to open a repository."""
-        result = dialogs.show_open_repository_dialog(self, self._repo_vm.repo_path)
-        if result:
-            self.open_repository(result)
+        dialogs.show_open_repository_dialog(
+            self, self.open_repository, self._repo_vm.repo_path
+        )
 
     # --- Status and error display ---
 
@@ -709,25 +1251,43 @@ class GitGuiWindow(Gtk.ApplicationWindow):
         MAX_STATUS_LENGTH = 100
 
         if len(message) > MAX_STATUS_LENGTH:
+            # Build the dialog after the current handler returns
             title = msg_type.get_message_dialog_title()
-            dialogs.show_message_dialog(self, title, message, msg_type)
-            truncated = message[:MAX_STATUS_LENGTH - 3] + '...'
-            self._status_bar.set_text(truncated)
-        else:
-            self._status_bar.set_text(message)
+            GLib.idle_add(dialogs.show_message_dialog, self, title, message, msg_type)
+            message = message[:MAX_STATUS_LENGTH - 3] + '...'
+
+        # Bursts of messages (e.g. staging several files) end in one update
+        self._pending_status = message
+        if not self._status_timer:
+            self._status_timer = GLib.timeout_add(50, self._flush_status)
+
+    def _flush_status(self):
+        """Write the latest buffered message to the status bar."""
+        self._status_timer = 0
+        if self._pending_status != self._shown_status:
+            self._status_bar.set_text(self._pending_status)
+            self._shown_status = self._pending_status
+        self._pending_status = None
+        return GLib.SOURCE_REMOVE
 
     def _show_error(self, title, message):
         """Show an error dialog."""
         dialogs.show_message_dialog(self, title, message, MessageType.ERROR)
 
-    def _show_status_dialog(self, title, message, success):
-        """Show a status dialog for operation results."""
-        msg_type = MessageType.INFO if success else MessageType.ERROR
-        dialogs.show_message_dialog(self, title, message, msg_type)
+    def _show_failure(self, title, success, message):
+        """_run_async completion callback: show an error dialog on failure."""
+        if not success:
+            self._show_error(title, message)
+
+    def _close_busy_dialog(self, busy, title, success, message):
+        """_run_async completion callback: close a busy dialog, then report failure."""
+        busy.destroy()
+        self._show_failure(title, success, message)
 
-    def _confirm_revert(self, title, detail, button_label):
+    def _confirm_revert(self, title, detail, button_label, on_confirm):
         """Show a destructive confirmation dialog.
 
-        Returns True if the user confirmed.
+        on_confirm is called once the user confirms; nothing happens if
+        the dialog is cancelled.
         """
-        return dialogs.show_confirm_dialog(self, title, detail, button_label)
+        dialogs.show_confirm_dialog(self, title, detail, button_label, on_confirm)